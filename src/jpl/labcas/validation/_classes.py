@@ -4,52 +4,198 @@
 
 from __future__ import annotations
 from functools import lru_cache
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import ClassVar, Optional
 from abc import ABC, abstractmethod
 from collections import defaultdict
-import pydicom, argparse, logging, re, csv, os.path, sqlite3
+from itertools import groupby
+from operator import attrgetter, itemgetter
+from weakref import WeakValueDictionary
+import pydicom, argparse, logging, re, csv, os.path, sqlite3, sys
 from pydicom.tag import Tag
 from pydicom import datadict
+from .const import FINDING_TYPE_IDS
 
 _logger = logging.getLogger(__name__)
 
-@dataclass
+# Regex for parsing organization parts from file paths that the fast path in PotentialFile can't handle
+_organization_re = re.compile(r'([^/]+)/(\d{7})/(.+)$')  # blah/blah/Images_site_XYX/1234567/f1/f2/…/file.dcm
+
+# Read-ahead advice for the kernel where the platform has it (not on macOS or Windows)
+_fadvise = getattr(os, 'posix_fadvise', None)
+
+# Columns of each CSV report and the buffer size for writing one; reports run to many megabytes
+_csv_header = ('Site ID', 'Event ID', 'File Name', 'Score', 'Findings', 'Details')
+_csv_buffering = 1 << 20
+
+# Connection settings for reading the findings database for a report: read-only, with a big page cache and
+# memory-mapped I/O
+_report_pragmas = (
+    'PRAGMA query_only = 1',
+    'PRAGMA cache_size = -200000',     # In KiB, so about 200 MB
+    'PRAGMA mmap_size = 1073741824',   # 1 GiB
+)
+
+# The one query a database report makes, giving every finding at or above a score in report order
+_report_sql = '''
+    SELECT site_id, event_id, file_path, finding_type, value, score, tag, description, pattern, index_val
+    FROM findings
+    WHERE score >= ?
+    ORDER BY site_id, event_id, file_path, finding_type, score DESC, id
+'''
+
+# Finding type names for the numbers that stand for them in the findings database
+_finding_type_names = {number: name for name, number in FINDING_TYPE_IDS.items()}
+
+# Kind strings for the finding type names stored in the findings database. Note these are spelled with plain
+# spaces, unlike the non-breaking spaces in each Finding class's «kind», and existing reports depend on that
+_kinds_by_finding_type = {
+    'ErrorFinding': '❌ Error',
+    'ValidationFinding': '⚠️ Missing Required Tags',
+    'HeaderFinding': '🙈 Possible PHI/PII in Header',
+    'ImageFinding': '🖼️ Possible Burned-in PHI/PII (Pixels)',
+    'WarningFinding': '👮 Warning',
+}
+
+
+@lru_cache(maxsize=4096)
+def _keyword(tag: int) -> str:
+    '''Return the DICOM keyword for the integer `tag`, caching the lookup since reports repeat the same few tags.'''
+    return datadict.keyword_for_tag(tag)
+
+
+def _keyword_for_tag(tag: Tag | None) -> str:
+    '''Return the DICOM keyword for the given `tag`, or "unknown tag" if there isn't one.'''
+    return _keyword(tag) if tag else 'unknown tag'
+
+
+@lru_cache(maxsize=4096)
+def _parse_tag_text(text: str) -> int | None:
+    '''Parse the "group,element" text (in decimal) that older findings databases hold a tag as into its value.'''
+    try:
+        group, element = (int(part) for part in text.split(','))
+    except ValueError:
+        return None
+    return (group << 16) | element if 0 <= group <= 0xFFFF and 0 <= element <= 0xFFFF else None
+
+
+def stored_tag(tag: int | str | None) -> int | None:
+    '''Return the 32-bit value of a `tag` as a findings database holds it, or None if there isn't one.
+
+    Databases store tags as integers, but those written by earlier versions have "group,element" text
+    like "16,16" for (0010,0010); we parse those, and text that doesn't parse is no tag, just as before.
+    '''
+    if isinstance(tag, str): return _parse_tag_text(tag)
+    return tag or None
+
+
+@dataclass(slots=True, weakref_slot=True)
 class PotentialFile:
     '''A file that we will scan for PHI/PII and check for compliance with EDRN validation requirements.'''
     path: str           # Relative path of the file
     site_id: str        # Blinded site ID
     event_id: str       # Event ID
     file_name: str      # File name
+    _ds_cache: dict[tuple[bool, bool], pydicom.Dataset] | None  # Datasets read so far, by (stop_before_pixels, force)
+    _hash: int          # Hash of the path, computed once
 
-    # Regex for parsing organization parts from file paths
-    _organization_re = re.compile(r'([^/]+)/(\d{7})/(.+)$')  # blah/blah/Images_site_XYX/1234567/f1/f2/…/file.dcm
+    # Pool of live potential files by path so callers can share one instance per file
+    _pool: ClassVar[WeakValueDictionary[str, PotentialFile]] = WeakValueDictionary()
 
     def __init__(self, path: str, site_id: str = None, event_id: str = None):
         '''Initialize the potential file with the given file path and optional site and event IDs.'''
-        self.path = path
+        self.path = path = sys.intern(path)  # Many findings and sets refer to the same path
+        self._hash = hash(path)
 
-        search_result = self._organization_re.search(path)
-        if search_result:
-            self.site_id, self.event_id, self.file_name = search_result.groups()
+        organization_parts = self._parse_organization_parts(path)
+        if organization_parts:
+            self.site_id, self.event_id, self.file_name = organization_parts
         else:
             self.site_id, self.event_id, self.file_name = '«unknown site»', '«unknown event»', os.path.basename(path)
 
+        self._set_ids(site_id, event_id)
+        self._ds_cache = None  # Made on the first cached read; most files waiting to be scanned never need one
+
+    @classmethod
+    def _parse_organization_parts(cls, path: str) -> tuple[str, str, str] | None:
+        '''Parse the site ID, event ID, and file name from `path`, or return None if it's not organized that way.
+
+        Nearly every path has the expected shape, so we find the first 7-digit component with plain string
+        operations and fall back to the regex only for paths that don't.
+        '''
+        parts = path.split('/')
+        for index in range(1, len(parts) - 1):
+            event_id = parts[index]
+            if len(event_id) == 7 and event_id.isdecimal() and parts[index - 1]:
+                file_name = '/'.join(parts[index + 1:])
+                if file_name: return parts[index - 1], event_id, file_name
+        search_result = _organization_re.search(path)
+        return search_result.groups() if search_result else None
+
+    def _set_ids(self, site_id: str = None, event_id: str = None):
+        '''Use the given site and event IDs, where given, in place of the ones we have.'''
         if site_id: self.site_id = site_id
         if event_id: self.event_id = event_id
+        # A handful of sites and events cover every file, so let them all share the same strings; IDs from Solr
+        # documents needn't be strings, though, and only strings can be interned
+        if isinstance(self.site_id, str): self.site_id = sys.intern(self.site_id)
+        if isinstance(self.event_id, str): self.event_id = sys.intern(self.event_id)
 
-    @lru_cache
-    def _read_dicom_file(self, stop_before_pixels: bool = False, force: bool = False) -> pydicom.Dataset:
-        '''Read the DICOM file and return a dataset.'''
-        return pydicom.dcmread(self.path, stop_before_pixels=stop_before_pixels, force=force)
+    @classmethod
+    def get(cls, path: str, site_id: str = None, event_id: str = None) -> PotentialFile:
+        '''Return the potential file for the given `path`, creating it only if there isn't one already alive.
 
-    def dcmread(self, stop_before_pixels: bool = False, force: bool = False, cache: bool = True) -> pydicom.Dataset:
-        '''Read the DICOM file and return a dataset.'''
+        Site and event IDs given here win over the ones the file has, just as they do when it's created, so
+        a file first made from its path alone picks up the ones from Solr when they come along.
+        '''
+        potential_file = cls._pool.get(path)
+        if potential_file is None:
+            potential_file = cls(path, site_id=site_id, event_id=event_id)
+            cls._pool[path] = potential_file
+        elif site_id or event_id:
+            potential_file._set_ids(site_id, event_id)
+        return potential_file
+
+    def dcmread(
+        self, stop_before_pixels: bool = False, force: bool = False, cache: bool = True,
+        specific_tags: Optional[tuple[Tag, ...]] = None
+    ) -> pydicom.Dataset:
+        '''Read the DICOM file and return a dataset.
+
+        With `specific_tags`, only those tags are read. With `cache`, the dataset is kept on this potential
+        file and reused for the same arguments until `release` is called.
+        '''
+        key, ds_cache = (stop_before_pixels, force, specific_tags), self._ds_cache
+        ds = ds_cache.get(key) if cache and ds_cache else None
+        if ds is None:
+            with open(self.path, 'rb') as io:
+                if _fadvise is not None:
+                    # pydicom reads in small pieces, so tell the kernel to read ahead; a read with the pixels
+                    # takes the whole file, so it may as well start fetching all of it now
+                    _fadvise(io.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    if not stop_before_pixels: _fadvise(io.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                ds = pydicom.dcmread(
+                    io, stop_before_pixels=stop_before_pixels, force=force, specific_tags=specific_tags
+                )
+            if cache:
+                if ds_cache is None: ds_cache = self._ds_cache = {}
+                ds_cache[key] = ds
+        return ds
+
+    def cached_dataset(self, stop_before_pixels: bool = False, force: bool = False) -> pydicom.Dataset | None:
+        '''Return the whole-file dataset already read and cached with these arguments, or None if there isn't one.
+
+        A dataset read with the pixels has everything one read without them has, so it serves for either.
+        '''
+        ds_cache = self._ds_cache
+        if not ds_cache: return None
+        ds = ds_cache.get((stop_before_pixels, force, None))
+        if ds is None and stop_before_pixels: ds = ds_cache.get((False, force, None))
+        return ds
 
-        if cache:
-            return self._read_dicom_file(stop_before_pixels, force)
-        else:
-            return pydicom.dcmread(self.path, stop_before_pixels=stop_before_pixels, force=force)
+    def release(self):
+        '''Drop any cached datasets so their memory can be reclaimed once we're done with this file.'''
+        self._ds_cache = None
 
     def __repr__(self) -> str:
         '''Return a convenient representation of the potential file.'''
@@ -64,7 +210,11 @@ class PotentialFile:
 
     def __hash__(self) -> int:
         '''Return a hash of the potential file.'''
-        return hash(self.path)
+        return self._hash
+
+    def __reduce__(self) -> tuple:
+        '''Pickle by reconstructing from the path so the hash is redone and no cached datasets go along.'''
+        return self.__class__, (self.path, self.site_id, self.event_id)
 
     def __eq__(self, other: PotentialFile) -> bool:
         '''Return True if the two potential files are equal.'''
@@ -75,17 +225,19 @@ class PotentialFile:
         return self.path < other.path
         
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
-    '''A finding in a DICOM file.'''
+    '''A finding in a DICOM file.
+
+    Findings are slotted since a big scan makes lots of them. Because `slots=True` rebuilds each class,
+    subclass methods call `super` with explicit arguments (zero-argument `super` would see the old class).
+    '''
     file: PotentialFile           # The potential file that contains the finding
     value: str                    # Text value of the finding
     score: float = 1.0            # Severity, where 0.0 is nothing and 1.0 is completely severe
+    _hash: int | None = field(default=None, init=False, repr=False, compare=False)  # Cached by __hash__
 
-    @abstractmethod
-    def kind(self) -> str:
-        '''Return the kind of this finding.'''
-        raise NotImplementedError(f'{self.__class__.__name__} must implement the «kind» method')
+    kind: ClassVar[str]           # Kind of this finding; concrete subclasses must define it
 
     @abstractmethod
     def report(self) -> list[str]:
@@ -106,26 +258,54 @@ class Finding:
         '''
         return self.file.site_id, self.file.event_id, self.file.path
 
+    def _hash_key(self) -> tuple:
+        '''Return the values this finding hashes on; subclasses add their own fields.'''
+        return self.file.path, self.value, self.score
+
     def __hash__(self) -> int:
-        '''Return a hash of the finding.'''
-        return hash((self.file.path, self.value, self.score))
+        '''Return a hash of the finding, computed on first use and kept, so don't change a finding once hashed.
+
+        Subclasses are dataclasses that define __eq__, so each must set `__hash__ = Finding.__hash__`
+        to keep this one.
+        '''
+        h = self._hash
+        if h is None: h = self._hash = hash(self._hash_key())
+        return h
+
+    def __getstate__(self) -> tuple[None, dict]:
+        '''Pickle without the cached hash, as string hashes differ from one process to the next.'''
+        state, slots = object.__getstate__(self)
+        slots['_hash'] = None
+        return state, slots
 
     def __eq__(self, other: Finding) -> bool:
         '''Return True if the two findings are equal.'''
         return self.file.path == other.file.path and self.value == other.value
 
     def __lt__(self, other: Finding) -> bool:
-        '''Return True if the current finding is less than the other finding.'''
-        return self.file.path < other.file.path or (self.file.path == other.file.path and self.value < other.value and self.score < other.score)
+        '''Return True if the current finding is less than the other finding.
+
+        Findings order by class name and then by the same fields they hash on, so subclasses that extend
+        `_hash_key` need no `__lt__` of their own.
+        '''
+        return self._sort_key() < other._sort_key()
+
+    def _sort_key(self) -> tuple:
+        '''Return the finding's class name and hash key fields as something any two findings can compare.
+
+        Findings of different classes have different fields, so the class name goes first. Fields such as
+        tag and description may be None, so each is paired with whether it is None: a None sorts after
+        any value and is never compared with one.
+        '''
+        return (type(self).__name__, *((value is None, value) for value in self._hash_key()))
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorFinding(Finding):
     '''A finding in a DICOM file that is an error.'''
     error_message: str | None = None
 
-    def kind(self) -> str:
-        return '❌ Error'
+    kind: ClassVar[str] = '❌ Error'
 
     def report(self) -> list[str]:
         return [self.value, self.error_message]
@@ -134,106 +314,95 @@ class ErrorFinding(Finding):
         '''Generate database fields for this error finding.'''
         return (self.__class__.__name__, self.error_message, None, None, None)
     
-    def __hash__(self) -> int:
-        '''Return a hash of the error finding.'''
-        return super().__hash__() ^ hash(self.error_message)
+    __hash__ = Finding.__hash__
+
+    def _hash_key(self) -> tuple:
+        '''Return the values this error finding hashes on.'''
+        return super(ErrorFinding, self)._hash_key() + (self.error_message,)
 
     def __eq__(self, other: ErrorFinding) -> bool:
         '''Return True if the two error findings are equal.'''
-        return super().__eq__(other) and self.error_message == other.error_message
-
-    def __lt__(self, other: ErrorFinding) -> bool:
-        '''Return True if the current error finding is less than the other error finding.'''
-        return super().__lt__(other) or (super().__eq__(other) and self.error_message < other.error_message)
+        return super(ErrorFinding, self).__eq__(other) and self.error_message == other.error_message
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationFinding(Finding):
     '''A finding in a DICOM file that is a validation problem.'''
 
     tag: Tag | None = None
     description: str | None = None
 
-    def kind(self) -> str:
-        return '⚠️ Missing Required Tags'
+    kind: ClassVar[str] = '⚠️ Missing Required Tags'
 
     def report(self) -> list[str]:
         if self.description:
             detail = f'Failed core tag validation: {self.description} — please review for completeness and format'
         else:
             detail = 'Failed core tag validation — please review for completeness and format'
-        tag_name = datadict.keyword_for_tag(self.tag) if self.tag else 'unknown tag'
+        tag_name = _keyword_for_tag(self.tag)
         return [f'{self.tag} ({tag_name})', f'«{self.value}»', detail]
 
     def generate_database_fields(self) -> tuple[str, str | None, str | None, int | None, Tag | None]:
         '''Generate database fields for this validation finding.'''
         return (self.__class__.__name__, self.description, None, None, self.tag)
 
-    def __hash__(self) -> int:
-        '''Return a hash of the validation finding.'''
-        return super().__hash__() ^ hash(self.tag) ^ hash(self.description)
+    __hash__ = Finding.__hash__
+
+    def _hash_key(self) -> tuple:
+        '''Return the values this validation finding hashes on.'''
+        return super(ValidationFinding, self)._hash_key() + (self.tag, self.description)
 
     def __eq__(self, other: ValidationFinding) -> bool:
         '''Return True if the two validation findings are equal.'''
-        return super().__eq__(other) and self.tag == other.tag and self.description == other.description
+        return super(ValidationFinding, self).__eq__(other) and self.tag == other.tag and self.description == other.description
 
-    def __lt__(self, other: ValidationFinding) -> bool: 
-        '''Return True if the current validation finding is less than the other validation finding.'''
-        return super().__lt__(other) or (super().__eq__(other) and self.tag < other.tag and self.description < other.description)
 
-
-@dataclass
+@dataclass(slots=True)
 class WarningFinding(Finding):
     '''A finding in a DICOM file that is a warning.'''
 
     tag: Tag | None = None
     description: str | None = None
 
-    def kind(self) -> str:
-        return '👮 Warning'
+    kind: ClassVar[str] = '👮 Warning'
     
     def report(self) -> list[str]:
         if self.description:
             detail = f'Warning: {self.description}'
         else:
             detail = 'Warning for not a more specific reason'
-        tag_name = datadict.keyword_for_tag(self.tag) if self.tag else 'unknown tag'
+        tag_name = _keyword_for_tag(self.tag)
         return [f'{self.tag} ({tag_name})', f'«{self.value}»', detail]    
 
     def generate_database_fields(self) -> tuple[str, str | None, str | None, int | None, Tag | None]:
         '''Generate database fields for this warning finding.'''
         return (self.__class__.__name__, self.description, None, None, self.tag)
     
-    def __hash__(self) -> int:
-        '''Return a hash of the warning finding.'''
-        return super().__hash__() ^ hash(self.description)
+    __hash__ = Finding.__hash__
+
+    def _hash_key(self) -> tuple:
+        '''Return the values this warning finding hashes on.'''
+        return super(WarningFinding, self)._hash_key() + (self.description,)
     
     def __eq__(self, other: WarningFinding) -> bool:
         '''Return True if the two warning findings are equal.'''
-        return super().__eq__(other) and self.tag == other.tag and self.description == other.description
+        return super(WarningFinding, self).__eq__(other) and self.tag == other.tag and self.description == other.description
 
-    def __lt__(self, other: WarningFinding) -> bool:
-        '''Return True if the current warning finding is less than the other warning finding.'''
-        return super().__lt__(other) or (super().__eq__(other) and self.tag < other.tag and self.description < other.warning_message)
 
-
-@dataclass
+@dataclass(slots=True)
 class PHI_PII_Finding(Finding):
     '''A finding in a DICOM file that is PHI or PII.'''
     
-    def __hash__(self) -> int:
-        '''Return a hash of the PHI/PII finding.'''
-        return super().__hash__()
+    __hash__ = Finding.__hash__
 
 
-@dataclass
+@dataclass(slots=True)
 class HeaderFinding(PHI_PII_Finding):
     '''A finding in a DICOM header.'''
     tag: Tag | None = None
     description: str | None = None
 
-    def kind(self) -> str:
-        return '🙈 Possible PHI/PII in Header'
+    kind: ClassVar[str] = '🙈 Possible PHI/PII in Header'
 
     def report(self) -> list[str]:
         if self.description:
@@ -241,7 +410,7 @@ class HeaderFinding(PHI_PII_Finding):
         else:
             detail = f'Possible PHI/PII detection (score {self.score:.2f})'
         if self.tag:
-            tag_str = f'{self.tag} ({datadict.keyword_for_tag(self.tag)})'
+            tag_str = f'{self.tag} ({_keyword_for_tag(self.tag)})'
         else:
             tag_str = 'unknown tag'
         return [tag_str, f'«{self.value}»', detail]
@@ -250,27 +419,24 @@ class HeaderFinding(PHI_PII_Finding):
         '''Generate database fields for this header finding.'''
         return (self.__class__.__name__, self.description, None, None, self.tag)
 
-    def __hash__(self) -> int:
-        '''Return a hash of the header finding.'''
-        return super().__hash__() ^ hash(self.tag) ^ hash(self.description)
+    __hash__ = Finding.__hash__
+
+    def _hash_key(self) -> tuple:
+        '''Return the values this header finding hashes on.'''
+        return super(HeaderFinding, self)._hash_key() + (self.tag, self.description)
 
     def __eq__(self, other: HeaderFinding) -> bool:
         '''Return True if the two header findings are equal.'''
-        return super().__eq__(other) and self.tag == other.tag and self.description == other.description
-
-    def __lt__(self, other: HeaderFinding) -> bool:
-        '''Return True if the current header finding is less than the other header finding.'''
-        return super().__lt__(other) or (super().__eq__(other) and self.tag < other.tag and self.description < other.description)
+        return super(HeaderFinding, self).__eq__(other) and self.tag == other.tag and self.description == other.description
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageFinding(PHI_PII_Finding):
     '''A finding in a DICOM image.'''
     pattern: str = 'unknown'
     index: int = -1
 
-    def kind(self) -> str:
-        return '🖼️ Possible Burned-in PHI/PII (Pixels)'
+    kind: ClassVar[str] = '🖼️ Possible Burned-in PHI/PII (Pixels)'
 
     def report(self) -> list[str]:
         # 🔮 Figure out how to describe OCR PHI/PII
@@ -280,23 +446,23 @@ class ImageFinding(PHI_PII_Finding):
         '''Generate database fields for this image finding.'''
         return (self.__class__.__name__, None, self.pattern, self.index, None)
 
-    def __hash__(self) -> int:
-        '''Return a hash of the image finding.'''
-        return super().__hash__() ^ hash(self.pattern) ^ hash(self.index)
+    __hash__ = Finding.__hash__
+
+    def _hash_key(self) -> tuple:
+        '''Return the values this image finding hashes on.'''
+        return super(ImageFinding, self)._hash_key() + (self.pattern, self.index)
 
     def __eq__(self, other: ImageFinding) -> bool:
         '''Return True if the two image findings are equal.'''
-        return super().__eq__(other) and self.pattern == other.pattern and self.index == other.index
-
-    def __lt__(self, other: ImageFinding) -> bool:  
-        '''Return True if the current image finding is less than the other image finding.'''
-        return super().__lt__(other) or (super().__eq__(other) and self.pattern < other.pattern and self.index < other.index)
+        return super(ImageFinding, self).__eq__(other) and self.pattern == other.pattern and self.index == other.index
 
 
 class PHI_PII_Recognizer(ABC):
     '''Base class for PHI/PII recognizers.'''
 
     description: ClassVar[str]
+    needs_pixels: ClassVar[bool] = False  # If False, only the header (stop_before_pixels) dataset is read
+    reads_header: ClassVar[bool] = False  # If True, «recognize» reads the whole header, which validators can share
 
     def __init__(self, args: argparse.Namespace):
         '''Initialize the recognizer with the given arguments.
@@ -322,29 +488,54 @@ class Validator(ABC):
 
     description: ClassVar[str]
     tag: ClassVar[Tag]
+    needs_pixels: ClassVar[bool] = False  # If False, only the header (stop_before_pixels) dataset is read
+    required_tags: ClassVar[tuple[Tag, ...]] = ()  # Tags besides «tag» that «validate» looks at
+    header_tags: ClassVar[Optional[tuple[Tag, ...]]] = None  # Tags to read for every validator; None for all
 
     def __init_subclass__(cls, **kwargs):
         '''Initialize the subclass.'''
         super().__init_subclass__(**kwargs)
         # Skip checking specific intermediate abstract classes like RegexValidator
         # These classes have their own __init_subclass__ that will enforce requirements
-        if cls.__name__ in ('RegexValidator', 'DICOMUIDValidator'):
+        if cls.__name__ in ('RegexValidator', 'DICOMUIDValidator', 'MonochromeGatedValidator'):
             return
         
         # Only enforce attribute requirements for concrete classes (not abstract intermediate classes)
-        # Check if this class is abstract by looking for @abstractmethod decorators in the class
-        import inspect
-        abstract_methods = [
-            name for name, method in inspect.getmembers(cls, predicate=inspect.isfunction)
-            if getattr(method, '__isabstractmethod__', False)
-        ]
-        if abstract_methods:  # If class has abstract methods, skip the requirement check
-            return
+        if cls._is_abstract(): return
         # Otherwise enforce the requirement
         for attr in ('description', 'tag'):
             if not hasattr(cls, attr):
                 raise TypeError(f'{cls.__name__} must define a «{attr}» class attribute')
 
+    @classmethod
+    def _is_abstract(cls) -> bool:
+        '''Tell if this class still has abstract methods.
+
+        ABCMeta doesn't set `__abstractmethods__` until after `__init_subclass__` runs, so this applies the
+        same rule it uses: an abstract method defined here, or an inherited one that's still abstract.
+        '''
+        if any(getattr(value, '__isabstractmethod__', False) for value in vars(cls).values()): return True
+        return any(
+            getattr(getattr(cls, name, None), '__isabstractmethod__', False)
+            for base in cls.__bases__ for name in getattr(base, '__abstractmethods__', ())
+        )
+
+    def dcmread(self, potential_file: PotentialFile) -> pydicom.Dataset:
+        '''Read the dataset of `potential_file` that validators look at.
+
+        If the whole header has already been read, every validator uses that. Otherwise they all ask for the
+        same `header_tags`, so the file is parsed once for all of them. A validator whose tags aren't among
+        them (one that isn't registered, say) reads the whole header instead.
+        '''
+        ds = potential_file.cached_dataset(stop_before_pixels=not self.needs_pixels)
+        if ds is not None: return ds
+        specific_tags = self.header_tags
+        if specific_tags is not None and not all(tag in specific_tags for tag in (self.tag, *self.required_tags)):
+            specific_tags = None
+        return potential_file.dcmread(
+            stop_before_pixels=not self.needs_pixels, force=False, specific_tags=specific_tags
+        )
+
     @abstractmethod
     def validate(self, potential_file: PotentialFile) -> list[ValidationFinding]:
         '''Validate the given DICOM dataset and return a list of findings.'''
@@ -377,61 +568,63 @@ class Report:
         self.findings = findings
         self.db_path = db_path
         self.score = score
+        self._organized: Optional[dict[tuple[str, str, str], list[Finding]]] = None  # Cache for _organize_report
 
     def _get_finding_kind(self, finding_type: str) -> str:
         '''Get the kind string for a finding type.'''
-        kind_map = {
-            'ErrorFinding': '❌ Error',
-            'ValidationFinding': '⚠️ Missing Required Tags',
-            'HeaderFinding': '🙈 Possible PHI/PII in Header',
-            'ImageFinding': '🖼️ Possible Burned-in PHI/PII (Pixels)',
-            'WarningFinding': '👮 Warning',
-        }
-        return kind_map.get(finding_type, '❓ Unknown')
-
-    def _format_finding_report(self, finding_type: str, value: str, score: float, tag: Optional[str], 
+        return _kinds_by_finding_type.get(finding_type, '❓ Unknown')
+
+    def _format_message_row(self, finding_type: str, value: str, score: float, tag: Optional[int],
+                            description: Optional[str], pattern: Optional[str], index_val: Optional[int]) -> list[str]:
+        '''Format an error or warning finding's report: its value and message.'''
+        return [value, description or '']
+
+    def _format_validation_row(self, finding_type: str, value: str, score: float, tag: Optional[int],
+                               description: Optional[str], pattern: Optional[str], index_val: Optional[int]) -> list[str]:
+        '''Format a validation finding's report.'''
+        if description:
+            detail = f'Failed core tag validation: {description} — please review for completeness and format'
+        else:
+            detail = 'Failed core tag validation — please review for completeness and format'
+        return [self._format_finding_tag(finding_type, tag), f'«{value}»', detail]
+
+    def _format_header_row(self, finding_type: str, value: str, score: float, tag: Optional[int],
+                           description: Optional[str], pattern: Optional[str], index_val: Optional[int]) -> list[str]:
+        '''Format a header PHI/PII finding's report.'''
+        if description:
+            detail = f'Possible PHI/PII detection (score {score:.2f}): {description}'
+        else:
+            detail = f'Possible PHI/PII detection (score {score:.2f})'
+        return [self._format_finding_tag(finding_type, tag), f'«{value}»', detail]
+
+    def _format_image_row(self, finding_type: str, value: str, score: float, tag: Optional[int],
+                          description: Optional[str], pattern: Optional[str], index_val: Optional[int]) -> list[str]:
+        '''Format an image PHI/PII finding's report.'''
+        return [value, f'Detected with pattern {pattern or "unknown"} at frame index {index_val or -1}']
+
+    # Row formatters by the finding type names stored in the findings database
+    _row_formatters = {
+        'ErrorFinding': _format_message_row,
+        'ValidationFinding': _format_validation_row,
+        'HeaderFinding': _format_header_row,
+        'ImageFinding': _format_image_row,
+        'WarningFinding': _format_message_row,
+    }
+
+    def _format_finding_report(self, finding_type: str, value: str, score: float, tag: Optional[int], 
                                 description: Optional[str], pattern: Optional[str], index_val: Optional[int]) -> list[str]:
         '''Format finding report as a list of strings (matching the report() method format).'''
-        from pydicom import datadict
-        
-        if finding_type == 'ErrorFinding':
-            return [value, description or '']
-        elif finding_type == 'ValidationFinding':
-            if description:
-                detail = f'Failed core tag validation: {description} — please review for completeness and format'
-            else:
-                detail = 'Failed core tag validation — please review for completeness and format'
-            tag_str = self._format_finding_tag(finding_type, tag)
-            return [tag_str, f'«{value}»', detail]
-        elif finding_type == 'HeaderFinding':
-            if description:
-                detail = f'Possible PHI/PII detection (score {score:.2f}): {description}'
-            else:
-                detail = f'Possible PHI/PII detection (score {score:.2f})'
-            tag_str = self._format_finding_tag(finding_type, tag)
-            return [tag_str, f'«{value}»', detail]
-        elif finding_type == 'ImageFinding':
-            return [value, f'Detected with pattern {pattern or "unknown"} at frame index {index_val or -1}']
-        elif finding_type == 'WarningFinding':
-            return [value, description or '']
-        else:
-            return [value]
+        formatter = self._row_formatters.get(finding_type)
+        if formatter is None: return [value]
+        return formatter(self, finding_type, value, score, tag, description, pattern, index_val)
 
-    def _format_finding_tag(self, finding_type: str, tag: Optional[str]) -> str:
-        '''Format tag information for CSV output.'''
-        from pydicom import datadict
-        
+    def _format_finding_tag(self, finding_type: str, tag: Optional[int]) -> str:
+        '''Format tag information for CSV output.
+
+        The database keeps tags as their 32-bit value, so format it the way `Tag` prints without making one.
+        '''
         if finding_type in ('ValidationFinding', 'HeaderFinding') and tag:
-            try:
-                parts = tag.split(',')
-                if len(parts) == 2:
-                    group = int(parts[0])
-                    element = int(parts[1])
-                    tag_obj = Tag((group, element))
-                    tag_name = datadict.keyword_for_tag(tag_obj)
-                    return f'{tag_obj} ({tag_name})'
-            except:
-                pass
+            return f'({tag >> 16:04X},{tag & 0xFFFF:04X}) ({_keyword(tag)})'
         return 'unknown tag'
 
     def generate_csv_report(self, output_directory: str):
@@ -441,127 +634,95 @@ class Report:
         Otherwise, uses the findings list.
         '''
         _logger.info('📝 Generating CSV reports')
-        _header = ['Site ID', 'Event ID', 'File Name', 'Score', 'Findings', 'Details']
+        join_details = ', '.join  # Bound once here rather than looked up again for every row
+        type_name = _finding_type_names.get
 
         if self.db_path:
-            # Query database directly for memory efficiency
+            # Stream the findings in report order with a single query so only one file's rows are in memory
             _logger.info('Opening database at %s for reading', self.db_path)
             conn = sqlite3.connect(self.db_path, timeout=30.0)
             try:
-                # Get all unique site_ids
-                cursor = conn.execute('''
-                    SELECT DISTINCT site_id 
-                    FROM findings 
-                    WHERE score >= ?
-                    ORDER BY site_id
-                ''', (self.score,))
-                
-                site_ids = [row[0] for row in cursor.fetchall()]
-                _logger.info('Found %d unique site IDs', len(site_ids))
-
-                for site_id in site_ids:
-                    _logger.info('Processing site ID %s', site_id)
-                    # Get all findings for this site (all events), grouped by file
-                    cursor = conn.execute('''
-                        SELECT event_id, file_path, file_name, finding_type, value, score, tag, description, pattern, index_val
-                        FROM findings
-                        WHERE site_id = ? AND score >= ?
-                        ORDER BY event_id, file_path, finding_type, score DESC
-                    ''', (site_id, self.score))
-                    
-                    # Group by event_id, file_path, and finding_type
-                    event_file_findings: defaultdict[str, defaultdict[str, defaultdict[str, list]]] = defaultdict(
-                        lambda: defaultdict(lambda: defaultdict(list))
-                    )
-                    for row in cursor:
-                        event_id, file_path, file_name, finding_type, value, score, tag, description, pattern, index_val = row
-                        event_file_findings[event_id][file_path][finding_type].append({
-                            'value': value,
-                            'score': score,
-                            'tag': tag,
-                            'description': description,
-                            'pattern': pattern,
-                            'index_val': index_val
-                        })
-                    
-                    # Process each event for this site
-                    for event_id in sorted(event_file_findings.keys()):
-                        # Write CSV file for this site_id-event_id combination
-                        output_file = os.path.join(output_directory, f'{site_id}-{event_id}.csv')
-                        _logger.info('Processing event ID %s and opening file %s', event_id, output_file)
-                        with open(output_file, 'w', newline='') as io:
-                            writer = csv.writer(io)
-                            writer.writerow(_header)
-                            
-                            file_findings = event_file_findings[event_id]
-                            for file_path, finding_types in sorted(file_findings.items()):
-                                file_name = os.path.basename(file_path)
-                                kinds = sorted(finding_types.keys())
-                                
-                                for kind_type in kinds:
-                                    kind = self._get_finding_kind(kind_type)
-                                    findings_list = finding_types[kind_type]
-                                    
-                                    # Sort by score descending
-                                    findings_list.sort(key=lambda x: x['score'], reverse=True)
-                                    
-                                    for finding_data in findings_list:
-                                        report_parts = self._format_finding_report(
-                                            kind_type, finding_data['value'], finding_data['score'],
-                                            finding_data['tag'], finding_data['description'],
-                                            finding_data['pattern'], finding_data['index_val']
-                                        )
-                                        details = ", ".join(report_parts)
-                                        
-                                        writer.writerow([
-                                            site_id, 
-                                            event_id, 
-                                            file_name, 
-                                            finding_data['score'], 
-                                            kind,
-                                            details
-                                        ])
+                for pragma in _report_pragmas: conn.execute(pragma)
+                cursor = conn.execute(_report_sql, (self.score,))
+
+                current_site_id = None
+                for (site_id, event_id), site_event_rows in groupby(cursor, key=itemgetter(0, 1)):
+                    if site_id != current_site_id:
+                        _logger.info('Processing site ID %s', site_id)
+                        current_site_id = site_id
+
+                    # Write CSV file for this site_id-event_id combination
+                    output_file = os.path.join(output_directory, f'{site_id}-{event_id}.csv')
+                    _logger.info('Processing event ID %s and opening file %s', event_id, output_file)
+                    with open(output_file, 'w', newline='', buffering=_csv_buffering) as io:
+                        writer = csv.writer(io)
+                        writer.writerow(_csv_header)
+                        for file_path, file_rows in groupby(site_event_rows, key=itemgetter(2)):
+                            file_name = os.path.basename(file_path)
+                            # Rows arrive sorted by finding type and then by descending score
+                            rows = []
+                            for _, _, _, type_id, value, score, tag, description, pattern, index_val in file_rows:
+                                finding_type = type_name(type_id, type_id)  # Older databases have the names…
+                                tag = stored_tag(tag)                        # …and tags as text
+                                rows.append([
+                                    site_id, event_id, file_name, score, self._get_finding_kind(finding_type),
+                                    join_details(self._format_finding_report(
+                                        finding_type, value, score, tag, description, pattern, index_val
+                                    ))
+                                ])
+                            writer.writerows(rows)
             finally:
                 _logger.info('Closing database connection')
                 conn.close()
         else:
             # Use in-memory findings list (single-process mode)
             _logger.info('Using in-memory findings list')
-            organized = self._organize_report()
-            for site_id, event_ids in organized.items():
-                # Process all events for this site
-                for event_id in sorted(event_ids.keys()):
-                    # Write CSV file for this site_id-event_id combination
-                    with open(f'{site_id}-{event_id}.csv', 'w', newline='') as io:
-                        writer = csv.writer(io)
-                        writer.writerow(_header)
-                        file_names = event_ids[event_id]
-                        for file_name, findings in sorted(file_names.items()):
-                            kinds = sorted(list(set([f.kind() for f in findings])))
-                            for kind in kinds:
-                                scored_findings = sorted(
-                                    [f for f in findings if f.score >= self.score and f.kind() == kind],
-                                    key=lambda x: x.score, reverse=True
-                                )
-                                if len(scored_findings) > 0:
-                                    for finding in scored_findings:
-                                        score, details = finding.score, ", ".join(finding.report())
-                                        writer.writerow([site_id, event_id, file_name, score, kind, details])
+            organized, threshold = self._organize_report(), self.score
+            # Sorting the flat keys puts each site-event's files together, so group on the first two parts
+            for (site_id, event_id), files in groupby(sorted(organized.items()), key=lambda item: item[0][:2]):
+                # Write CSV file for this site_id-event_id combination
+                with open(f'{site_id}-{event_id}.csv', 'w', newline='', buffering=_csv_buffering) as io:
+                    writer = csv.writer(io)
+                    writer.writerow(_csv_header)
+                    for (_, _, file_name), findings in files:
+                        # Bucket the findings at or above the threshold by kind in a single pass
+                        buckets: defaultdict[str, list[Finding]] = defaultdict(list)
+                        for f in findings:
+                            if f.score >= threshold:
+                                buckets[type(f).kind].append(f)
+                        # Collect this file's rows and hand them to the CSV writer all at once
+                        rows: list[list] = []
+                        for kind in sorted(buckets):
+                            bucket = buckets[kind]
+                            bucket.sort(key=attrgetter('score'), reverse=True)
+                            for finding in bucket:
+                                score, details = finding.score, join_details(finding.report())
+                                rows.append([site_id, event_id, file_name, score, kind, details])
+                        writer.writerows(rows)
         _logger.info('Finished generating CSV reports')
 
-    def _organize_report(self) -> dict:
+    def _organize_report(self) -> dict[tuple[str, str, str], list[Finding]]:
         '''Organize the report into a dictionary (used only when findings list is provided).
-    
-        The dictionary is organized by blinded site ID as a keys and values of dictionaries of event IDs
-        as keys and values of dictionaries of file names as keys and findings as values.
+
+        The dictionary is keyed by (blinded site ID, event ID, file path) tuples with lists of findings
+        as values; callers that need the site → event → file nesting can sort the keys and group them.
+        The result is computed once and reused by later calls.
         '''
         if not self.findings:
             raise ValueError('_organize_report() can only be used when findings list is provided')
-        
-        report: defaultdict[str, defaultdict[str, defaultdict[str, list[Finding]]]] = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+        if self._organized is not None: return self._organized
+
+        # A plain dict with get measured quicker here than defaultdict(list) and its subscript-then-append
+        report: dict[tuple[str, str, str], list[Finding]] = {}
         for finding in self.findings:
-            site_id, event_id, file_name = finding.organization_parts()
-            report[site_id][event_id][file_name].append(finding)
+            potential_file = finding.file
+            key = potential_file.site_id, potential_file.event_id, potential_file.path
+            file_findings = report.get(key)
+            if file_findings is None:
+                report[key] = [finding]
+            else:
+                file_findings.append(finding)
+        self._organized = report
         return report
 
     def generate_report(self, output_directory: str):
@@ -4,11 +4,17 @@
 
 from .errors import DirectoryError
 from .const import IGNORED_FILES, IGNORED_FOLDERS
+from pydicom.valuerep import DSfloat, IS
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable
-import re, os, pydicom, logging, os.path
+import os, pydicom, logging, os.path, sys
 
 _logger = logging.getLogger(__name__)
-_event_id_re = re.compile(r'^\d{7}$')
+_dicom_preamble_length = 128  # DICOM Part 10 files start with a 128-byte preamble…
+_dicom_magic = b'DICM'        # …followed by this prefix
+_number_types = frozenset((int, float, DSfloat, IS))  # Types textify_dicom_value can just str()
+_walk_threads = 8             # How many directories iterate_paths lists at once
 
 
 def check_directory(target: str):
@@ -50,21 +56,39 @@ def check_directory(target: str):
         #     if event in IGNORED_FILES: continue
         #     if not os.path.isdir(os.path.join(target, site, event)):
         #         raise DirectoryError(f'📄 Event {event} in site {site} in target directory {target} is not a directory')
-        #     if not _event_id_re.match(event):
+        #     if not (len(event) == 7 and event.isdecimal()):
         #         raise DirectoryError(f'❌ Unexpected format for event folder "{event}" in {target}/{site}')
     
-    # Now ensure there's at least one DICOM file somewhere under the target directory
-    for r, _, files in os.walk(target, followlinks=True):
-        for f in files:
-            candidate = os.path.join(r, f)
-            try:
-                pydicom.dcmread(candidate, stop_before_pixels=False, force=False)
-                return
-            except (IOError, pydicom.errors.InvalidDicomError) as ex:
-                continue
-            except Exception as ex:
-                raise DirectoryError(f'💥 Unexpected exception reading file {candidate}: {ex}')
-    raise DirectoryError(f'🫙 No valid DICOM files found in {target}')
+    # Now ensure there's at least one DICOM file somewhere under the target directory, stopping at the first
+    if not any(_is_dicom(entry.path) for _, files in _walk(target) for entry in files):
+        raise DirectoryError(f'🫙 No valid DICOM files found in {target}')
+
+
+def has_dicom_magic(candidate: str) -> bool:
+    '''Tell if the file at `candidate` has the DICM prefix after its preamble, as every DICOM file must.
+
+    This is a cheap check that rules out files that can't be DICOM before anything parses them; it can
+    raise IOError if the file can't be read.
+    '''
+    with open(candidate, 'rb') as io:
+        io.seek(_dicom_preamble_length)
+        return io.read(len(_dicom_magic)) == _dicom_magic
+
+
+def _is_dicom(candidate: str) -> bool:
+    '''Tell if the file at `candidate` is a readable DICOM file.
+
+    This peeks at the magic bytes first so we don't parse files that can't be DICOM, then confirms the
+    header of one that might be.
+    '''
+    try:
+        if not has_dicom_magic(candidate): return False
+        pydicom.dcmread(candidate, stop_before_pixels=True, specific_tags=['SOPClassUID'], force=False)
+        return True
+    except (IOError, pydicom.errors.InvalidDicomError) as ex:
+        return False
+    except Exception as ex:
+        raise DirectoryError(f'💥 Unexpected exception reading file {candidate}: {ex}')
 
 
 def textify_dicom_value(value: any) -> list[str]:
@@ -75,56 +99,124 @@ def textify_dicom_value(value: any) -> list[str]:
     100 characters, returns the text. If 100+ characters, truncates to 100 and adds ellipsis.
     Returns empty string for binary values that can't be decoded or anything else that can't be represented as text.
     '''
+    # Most values are a single string or number, so check their exact types before anything else
+    value_type = type(value)
+    if value_type is str: return [value]
+    if value_type in _number_types: return [str(value)]
+
     result: list[str] = []
-    
-    # Handle strings directly
-    if isinstance(value, str):
-        result.append(value)
-    # Handle binary data - attempt to decode to text
-    elif isinstance(value, (bytes, bytearray)):
-        try:
-            decoded_text = value.decode('utf-8', errors='replace')
-            if len(decoded_text) < 100:
-                result.append(decoded_text)
+
+    # Walk nested sequences with a stack of iterators rather than recursing, so everything lands in the
+    # one result list in the same order as a depth-first recursion would give
+    stack = [iter((value,))]
+    while stack:
+        for value in stack[-1]:
+            # Handle strings directly
+            if isinstance(value, str):
+                result.append(value)
+            # Handle binary data - attempt to decode to text
+            elif isinstance(value, (bytes, bytearray)):
+                try:
+                    decoded_text = value.decode('utf-8', errors='replace')
+                    if len(decoded_text) < 100:
+                        result.append(decoded_text)
+                    else:
+                        result.append(decoded_text[:100] + '…')
+                except Exception as ex:
+                    _logger.warning(f'Failed to decode binary DICOM value to text: {ex}')
+                    result.append('')
+            # Handle sequences - descend into the elements and pick up where we left off afterwards
+            elif isinstance(value, (list, tuple, set)):
+                stack.append(iter(value))
+                break
+            # Handle other types - try to convert to string if possible
             else:
-                result.append(decoded_text[:100] + '…')
-        except Exception as ex:
-            _logger.warning(f'Failed to decode binary DICOM value to text: {ex}')
-            result.append('')
-    # Handle sequences - recursively process each element and flatten
-    elif isinstance(value, (list, tuple, set)):
-        for v in value:
-            result.extend(textify_dicom_value(v))
-    # Handle other types - try to convert to string if possible
-    else:
-        try:
-            result.append(str(value))
-        except Exception:
-            # If conversion fails, return empty string
-            result.append('')
-    
+                try:
+                    result.append(str(value))
+                except Exception:
+                    # If conversion fails, return empty string
+                    result.append('')
+        else:
+            stack.pop()
+
     return result
 
 
 def modality(ds: pydicom.Dataset) -> str:
-    '''Determine the modality of the given DICOM dataset.'''
-    if hasattr(ds, 'Modality'):
-        modality = ds.Modality if ds.Modality is not None and ds.Modality.strip() != '' else 'UNKNOWN'
-    else:
-        modality = 'UNKNOWN'
-    return modality
+    '''Determine the modality of the given DICOM dataset.
+
+    There are only a handful of modalities, so the result is interned to make comparing it against a
+    literal such as 'MR' a pointer check.
+    '''
+    modality = ds.get('Modality')
+    if modality is None or modality.strip() == '': return 'UNKNOWN'
+    return sys.intern(modality)
+
 
 
+def _list_directory(directory: str, pruned: frozenset[str]) -> tuple[list[os.DirEntry], list[str]] | None:
+    '''List the regular files and the paths of the subdirectories not named in `pruned` in `directory`.
+
+    This gives None if the directory can't be read.
+    '''
+    files, subdirectories = [], []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        if entry.name in pruned: continue
+                        subdirectories.append(entry.path)
+                    elif entry.is_file():
+                        files.append(entry)
+                except OSError:
+                    continue
+    except OSError:
+        return None
+    return files, subdirectories
+
+
+def _walk(root: str, pruned: frozenset[str] = frozenset()) -> Iterable[tuple[str, list[os.DirEntry]]]:
+    '''Walk the tree at `root`, yielding each directory with the regular files in it.
+
+    This visits directories in the same order as `os.walk(root, followlinks=True)` and likewise skips
+    ones it can't read, but hands back `os.DirEntry` objects so callers get each file's path and type
+    from the directory listing without having to join or stat. Subdirectories named in `pruned` aren't
+    entered at all.
+    '''
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        listing = _list_directory(directory, pruned)
+        if listing is None: continue
+        files, subdirectories = listing
+        yield directory, files
+        stack.extend(reversed(subdirectories))
+
+
+def _walk_in_parallel(root: str, pruned: frozenset[str] = frozenset()) -> Iterable[list[os.DirEntry]]:
+    '''Walk the tree at `root` like `_walk`, but list several directories at once on threads.
+
+    On slow or networked storage the walk spends most of its time waiting on directory reads, which let go
+    of the GIL, so threads overlap them. Directories come out breadth first, in the order they were found,
+    so the order is still the same from one run to the next.
+    '''
+    with ThreadPoolExecutor(max_workers=_walk_threads) as executor:
+        pending = deque([executor.submit(_list_directory, root, pruned)])
+        while pending:
+            listing = pending.popleft().result()
+            if listing is None: continue
+            files, subdirectories = listing
+            pending.extend(executor.submit(_list_directory, subdirectory, pruned) for subdirectory in subdirectories)
+            yield files
+
 
 def iterate_paths(root: str) -> Iterable[str]:
     '''Iterate over the paths in the given directory.
 
     We can't assume DICOM files end in .dcm; a lot of them come in without extensions, so process every file.
     '''
-    for r, _, files in os.walk(root, followlinks=True):
-        dirname = os.path.basename(r)
-        if dirname in IGNORED_FOLDERS: continue
-        for f in files:
-            if f in IGNORED_FILES: continue
-            file_to_yield = os.path.join(r, f)
-            yield file_to_yield
+    for files in _walk_in_parallel(root, IGNORED_FOLDERS):
+        for entry in files:
+            if entry.name in IGNORED_FILES: continue
+            yield entry.path
@@ -7,7 +7,17 @@ PHI_PII_THRESHOLD = 0.8  # Default score ≥ to this means the file is probably
 PROCESS_TIMEOUT   = 30   # How many seconds to wait for a process to finish
 
 # Files to ignore when scanning for DICOM files
-IGNORED_FILES = {'.DS_Store', 'Thumbs.db', 'desktop.ini', 'DICOMDIR', 'Image.dir', 'Series.dir', '_OLD_'}
+IGNORED_FILES = frozenset({'.DS_Store', 'Thumbs.db', 'desktop.ini', 'DICOMDIR', 'Image.dir', 'Series.dir', '_OLD_'})
 
 # Folders whose contents we can skip completely
-IGNORED_FOLDERS = {'thumbnails'}
+IGNORED_FOLDERS = frozenset({'thumbnails'})
+
+# Numbers that stand for each finding type name in the findings database, numbered in alphabetical order so
+# sorting by number puts findings in the same order as sorting by name
+FINDING_TYPE_IDS = {
+    'ErrorFinding': 0,
+    'HeaderFinding': 1,
+    'ImageFinding': 2,
+    'ValidationFinding': 3,
+    'WarningFinding': 4,
+}
@@ -26,24 +26,38 @@ to get the summary.
 
 from . import VERSION
 from ._argparse import add_standard_argparse_options
-from ._classes import Finding, Report, ErrorFinding, PotentialFile
+from ._classes import Finding, Report, ErrorFinding, PotentialFile, ValidationFinding, HeaderFinding, ImageFinding, stored_tag
 from ._functions import check_directory, iterate_paths
-from .const import PHI_PII_THRESHOLD, IGNORED_FILES
+from .const import PHI_PII_THRESHOLD, IGNORED_FILES, FINDING_TYPE_IDS
 from .phi_pii_recognizers import PHI_PII_RECOGNIZERS, DEFAULT_PHI_PII_RECOGNIZER
-from .validators import VALIDATORS
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from multiprocessing import cpu_count
+from .validators import VALIDATORS, share_sibling_reads
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import cpu_count, get_all_start_methods, get_context, get_start_method
+from multiprocessing.util import Finalize
+from pydicom.tag import Tag
 from typing import Iterable
-import argparse, sys, logging, os, pydicom, pysolr, os.path, tempfile, sqlite3, threading, traceback
+from requests.adapters import HTTPAdapter
+import argparse, sys, logging, os, pydicom, pysolr, requests, os.path, tempfile, sqlite3, threading, traceback, queue
 
 
 __doc__ = '🛂 EDRN DICOM Validation: check for PHI/PII and compliance with EDRN core and MR requirements for DICOM tags'
 __copyright__ = 'Copyright © 2025 California Institute of Technology'
 __license__ = 'Apache 2.0'
 _recognizer = None  # The one recognizer we'll need for all workers for all files
+_prebuilt_recognizer = None  # A recognizer made before forking the workers, so they inherit rather than remake it
 _logger = logging.getLogger(__name__)
 _db_path = None  # Path to SQLite database for storing findings
-_db_lock = None  # Lock for database access (per-process)
+_db_queue = None  # Rows of findings waiting for this worker's database writer thread
+_db_writer = None  # This worker's database writer thread
+_db_queue_size = 1024  # How many files' worth of findings may wait for the writer before scanning holds off
+_db_put_timeout = 1.0  # How many seconds to wait on a full queue before checking the writer is still there
+_chunksize = 16  # How many files to hand a worker at once
+_solr_queries_in_flight = 4  # How many batches of files to check against Solr at once
+_solr_terms_separator = '|'  # Separates the IDs in a Solr terms query
+_load_batch_size = 10000  # How many findings to fetch from the database at once when loading them
+_finding_type_names = {number: name for name, number in FINDING_TYPE_IDS.items()}  # Back from database numbers
+_preload = ('pydicom', 'pysolr', 'jpl.labcas.validation.main')  # Imported once by the fork server, not per worker
 
 
 def _score_type(value: str) -> float:
@@ -65,40 +79,114 @@ def _init_worker(recognizer_name: str, recognizer_args: dict, db_path: str = Non
         recognizer_args: Dictionary of arguments for the recognizer
         db_path: Optional path to SQLite database (None for single-process mode)
     '''
-    global _recognizer, _db_path, _db_lock
-    # Configure logging for this worker process to match the parent process
-    logging.basicConfig(level=recognizer_args.get('loglevel', logging.INFO), format='%(levelname)s %(message)s')
-    _recognizer = PHI_PII_RECOGNIZERS[recognizer_name](argparse.Namespace(**recognizer_args))
+    global _recognizer, _db_path, _db_queue, _db_writer
+    # Configure logging for this worker process to match the parent process; forked workers (and the single
+    # process mode) already have the parent's handlers, so only fresh fork-server or spawned workers need it
+    if not logging.root.handlers:
+        logging.basicConfig(level=recognizer_args.get('loglevel', logging.INFO), format='%(levelname)s %(message)s')
+    if _prebuilt_recognizer is not None:
+        _recognizer = _prebuilt_recognizer
+    else:
+        _recognizer = PHI_PII_RECOGNIZERS[recognizer_name](argparse.Namespace(**recognizer_args))
+    # Every worker reads its files' siblings from the same storage, so they share one limit on doing that at once
+    share_sibling_reads(recognizer_args.get('concurrency') or 1)
     _db_path = db_path
-    _db_lock = threading.Lock() if db_path else None  # Only need lock if using database
+    if db_path:
+        _db_queue = queue.Queue(maxsize=_db_queue_size)
+        _db_writer = threading.Thread(
+            target=_write_findings_in_background, args=(db_path, _db_queue), name='findings-writer', daemon=True
+        )
+        _db_writer.start()
+        # Pool workers leave through multiprocessing's own exit handling, which skips atexit but runs finalizers
+        Finalize(None, _stop_writer, args=(_db_queue, _db_writer), exitpriority=10)
+
+
+# Settings for each worker's findings database connection; the database is scratch, so favor speed over durability
+_worker_pragmas = (
+    'PRAGMA synchronous = NORMAL',     # Safe with WAL: a crash may lose the last commits but not corrupt the file
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA cache_size = -65536',      # In KiB, so 64 MB
+)
+
+
+def _connect_worker_db(db_path: str) -> sqlite3.Connection:
+    '''Open the connection a worker uses to write findings to the database at `db_path`.'''
+    conn = sqlite3.connect(db_path, timeout=30.0)
+    for pragma in _worker_pragmas: conn.execute(pragma)
+    return conn
+
+
+_insert_finding_sql = '''
+    INSERT INTO findings (file_path, site_id, event_id, file_name, finding_type, value, score, tag, description, pattern, index_val)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
 
 
-def _write_finding_to_db(conn: sqlite3.Connection, finding: Finding):
-    '''Write a single finding to the database.'''
+def _finding_row(finding: Finding) -> tuple:
+    '''Flatten a finding into a row for the findings table.'''
     # Get database fields from the finding object itself (polymorphic call)
     finding_type, description, pattern, index, tag_obj = finding.generate_database_fields()
-    
-    # Serialize tag as "group,element" string for storage
-    tag_str = None
-    if tag_obj:
-        tag_str = f'{tag_obj.group},{tag_obj.element}'
-    
-    conn.execute('''
-        INSERT INTO findings (file_path, site_id, event_id, file_name, finding_type, value, score, tag, description, pattern, index_val)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (
-        finding.file.path,
-        finding.file.site_id,
-        finding.file.event_id,
-        finding.file.file_name,
-        finding_type,
-        finding.value,
-        finding.score,
-        tag_str,
-        description,
-        pattern,
-        index
-    ))
+
+    # Store the tag as its plain 32-bit value, (group << 16) | element, so nothing has to parse it back
+    tag_int = int(tag_obj) if tag_obj else None
+
+    potential_file = finding.file
+    return (
+        potential_file.path, potential_file.site_id, potential_file.event_id, potential_file.file_name,
+        FINDING_TYPE_IDS[finding_type], finding.value, finding.score, tag_int, description, pattern, index
+    )
+
+
+def _write_findings_in_background(db_path: str, rows_queue: queue.Queue):
+    '''Write the rows of findings from `rows_queue` to the database at `db_path` until given None.
+
+    This runs on a worker's writer thread so scanning carries on while SQLite works (it lets go of the GIL
+    while it does). Each batch goes in with one `executemany`, and we commit whenever we've caught up with
+    the queue rather than for every file.
+
+    Whatever goes wrong, we keep taking rows off the queue until told to stop, since the scan blocks once
+    the queue fills; rows we can't write are logged and dropped.
+    '''
+    try:
+        conn = _connect_worker_db(db_path)
+    except Exception as ex:
+        _logger.error('💥 Could not open %s to write findings, so they will be dropped: %s', db_path, ex)
+        conn = None
+    try:
+        while (rows := rows_queue.get()) is not None:
+            if conn is None: continue
+            try:
+                conn.executemany(_insert_finding_sql, rows)
+                if rows_queue.empty(): conn.commit()
+            except Exception as ex:
+                _logger.error('💥 Could not write %d findings to %s: %s', len(rows), db_path, ex)
+        if conn is not None: conn.commit()
+    finally:
+        if conn is not None: conn.close()
+
+
+def _put_for_writer(rows_queue: queue.Queue, writer: threading.Thread, item: list[tuple] | None):
+    '''Put `item` on the database writer's `rows_queue`, raising RuntimeError if the writer is gone.
+
+    A full queue only drains while the writer is running, so rather than block for good we wait a bit
+    at a time and give up once it's no longer there to take anything.
+    '''
+    while True:
+        if not writer.is_alive(): raise RuntimeError('💥 The findings database writer thread has stopped')
+        try:
+            rows_queue.put(item, timeout=_db_put_timeout)
+            return
+        except queue.Full:
+            continue
+
+
+def _stop_writer(rows_queue: queue.Queue, writer: threading.Thread):
+    '''Tell the database writer thread there are no more findings and wait for it to finish writing.'''
+    try:
+        _put_for_writer(rows_queue, writer, None)
+    except RuntimeError:
+        return  # Nothing's left to tell or wait for
+    writer.join()
 
 
 def _scan_one(potential_file: PotentialFile) -> int | list[Finding]:
@@ -109,28 +197,27 @@ def _scan_one(potential_file: PotentialFile) -> int | list[Finding]:
         - If db_path is None: list of Finding objects (for single-process mode)
     '''
     try:
+        # A recognizer that reads the whole header converts its elements in place as it goes, and validators
+        # expect them as read, so read that header now, let the validators have it first, and then the recognizer
+        if _recognizer.reads_header: potential_file.dcmread(stop_before_pixels=True, force=False)
+        validation_findings: list[Finding] = []
+        for validator in VALIDATORS:
+            validation_findings.extend(validator.validate(potential_file))
+
         # We need the pixel data because we also do OCR to see if there's PHI/PII burnt into the image
         findings: list[Finding] = []
         findings.extend(_recognizer.recognize(potential_file))
-        for validator in VALIDATORS:
-            findings.extend(validator.validate(potential_file))
+        findings.extend(validation_findings)
 
         if _db_path is None:
             # Single-process mode: return findings directly
             return findings
         
-        # Multi-process mode: write findings to database
+        # Multi-process mode: hand the findings' rows to this process's writer thread, which has its own
+        # connection to the database (SQLite handles concurrency well with separate connections)
         if findings:
-            # Each process gets its own connection (SQLite handles concurrency well with separate connections)
-            with _db_lock:  # Lock for thread-safety within this process
-                conn = sqlite3.connect(_db_path, timeout=30.0)
-                try:
-                    for finding in findings:
-                        _write_finding_to_db(conn, finding)
-                    conn.commit()
-                    return len(findings)
-                finally:
-                    conn.close()
+            _put_for_writer(_db_queue, _db_writer, [_finding_row(finding) for finding in findings])
+            return len(findings)
         return 0
     except pydicom.errors.InvalidDicomError as ex:
         _logger.error('🤷 Ignoring invalid DICOM file: %s', potential_file)
@@ -142,12 +229,17 @@ def _scan_one(potential_file: PotentialFile) -> int | list[Finding]:
         _logger.error('💥 Unexpected error processing file %s: %s', potential_file, ex)
         _logger.error(traceback.format_exc())
         return [] if _db_path is None else 0
+    finally:
+        # Findings keep a reference to the potential file, so don't let them keep its datasets alive too
+        potential_file.release()
 
 
 def _create_findings_db(db_path: str):
     '''Create the findings database schema.'''
     conn = sqlite3.connect(db_path, timeout=30.0)
     try:
+        # Write-ahead logging lets the workers commit without blocking each other's readers or rewriting pages twice
+        conn.execute('PRAGMA journal_mode = WAL')
         conn.execute('''
             CREATE TABLE IF NOT EXISTS findings (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -155,27 +247,42 @@ def _create_findings_db(db_path: str):
                 site_id TEXT NOT NULL,
                 event_id TEXT NOT NULL,
                 file_name TEXT NOT NULL,
-                finding_type TEXT NOT NULL,
+                finding_type INTEGER NOT NULL,
                 value TEXT NOT NULL,
                 score REAL NOT NULL,
-                tag TEXT,
+                tag INTEGER,
                 description TEXT,
                 pattern TEXT,
                 index_val INTEGER
             )
         ''')
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _index_findings_db(db_path: str):
+    '''Index the findings database once the workers are done writing to it.
+
+    Building the indexes in one go after the bulk inserts is cheaper than keeping them up to date during
+    them, and analyzing afterwards gives the query planner real statistics to choose them with.
+    '''
+    conn = sqlite3.connect(db_path, timeout=30.0)
+    try:
         conn.execute('CREATE INDEX IF NOT EXISTS idx_file_path ON findings(file_path)')
-        conn.execute('CREATE INDEX IF NOT EXISTS idx_site_event ON findings(site_id, event_id)')
+        # Matches the report's ORDER BY so the report can walk the index instead of sorting every finding
+        conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_report_order ON findings(site_id, event_id, file_path, finding_type, score DESC)'
+        )
+        conn.execute('ANALYZE')
         conn.commit()
+        conn.execute('PRAGMA optimize')
     finally:
         conn.close()
 
 
 def _load_findings_from_db(db_path: str) -> list[Finding]:
     '''Load all findings from the database and reconstruct Finding objects.'''
-    from ._classes import ErrorFinding, ValidationFinding, HeaderFinding, ImageFinding, PotentialFile
-    from pydicom.tag import Tag
-    
     findings = []
     conn = sqlite3.connect(db_path, timeout=30.0)
     try:
@@ -183,47 +290,56 @@ def _load_findings_from_db(db_path: str) -> list[Finding]:
             SELECT file_path, site_id, event_id, file_name, finding_type, value, score, tag, description, pattern, index_val
             FROM findings
         ''')
-        for row in cursor:
-            file_path, site_id, event_id, file_name, finding_type, value, score, tag, description, pattern, index_val = row
-            potential_file = PotentialFile(file_path, site_id=site_id, event_id=event_id)
+        # Take rows a big batch at a time; PotentialFile.get hands back the same object for a file's other findings
+        while rows := cursor.fetchmany(_load_batch_size):
+            for file_path, site_id, event_id, file_name, finding_type, value, score, tag, description, pattern, index_val in rows:
+                potential_file = PotentialFile.get(file_path, site_id=site_id, event_id=event_id)
+                finding_type = _finding_type_names.get(finding_type, finding_type)  # Older databases have the names
             
-            # Reconstruct Tag object if present (stored as "group,element")
-            tag_obj = None
-            if tag:
-                try:
-                    # Tag is stored as "group,element" (e.g., "16,16" for 0x0010,0x0010)
-                    parts = tag.split(',')
-                    if len(parts) == 2:
-                        group = int(parts[0])
-                        element = int(parts[1])
-                        tag_obj = Tag((group, element))
-                except (ValueError, TypeError) as ex:
-                    _logger.debug('Could not reconstruct tag from "%s": %s', tag, ex)
-                    pass
+                # Reconstruct Tag object if present (stored as its 32-bit value, e.g. 0x00100010, or as older text)
+                tag = stored_tag(tag)
+                tag_obj = Tag(tag) if tag else None
             
-            # Reconstruct the appropriate Finding subclass
-            finding = None
-            if finding_type == 'ErrorFinding':
-                finding = ErrorFinding(file=potential_file, value=value, score=score, error_message=description)
-            elif finding_type == 'ValidationFinding':
-                finding = ValidationFinding(file=potential_file, value=value, score=score, tag=tag_obj, description=description)
-            elif finding_type == 'HeaderFinding':
-                finding = HeaderFinding(file=potential_file, value=value, score=score, tag=tag_obj, description=description)
-            elif finding_type == 'ImageFinding':
-                finding = ImageFinding(file=potential_file, value=value, score=score, pattern=pattern or 'unknown', index=index_val or -1)
-            else:
-                # Unknown finding type - log warning and skip
-                _logger.warning('⚠️ Unknown finding type "%s" for file %s, skipping', finding_type, file_path)
-                continue
+                # Reconstruct the appropriate Finding subclass
+                finding = None
+                if finding_type == 'ErrorFinding':
+                    finding = ErrorFinding(file=potential_file, value=value, score=score, error_message=description)
+                elif finding_type == 'ValidationFinding':
+                    finding = ValidationFinding(file=potential_file, value=value, score=score, tag=tag_obj, description=description)
+                elif finding_type == 'HeaderFinding':
+                    finding = HeaderFinding(file=potential_file, value=value, score=score, tag=tag_obj, description=description)
+                elif finding_type == 'ImageFinding':
+                    finding = ImageFinding(file=potential_file, value=value, score=score, pattern=pattern or 'unknown', index=index_val or -1)
+                else:
+                    # Unknown finding type - log warning and skip
+                    _logger.warning('⚠️ Unknown finding type "%s" for file %s, skipping', finding_type, file_path)
+                    continue
             
-            if finding:
-                findings.append(finding)
+                if finding:
+                    findings.append(finding)
     finally:
         conn.close()
     
     return findings
 
 
+def _warm_up():
+    '''Do nothing; handing this to the worker pool just gets its workers started.'''
+
+
+def _pool_context():
+    '''Get the multiprocessing context for the worker pool, or None for the default.
+
+    Forked workers already share everything this process imported. Where the default is to spawn
+    fresh interpreters instead, we use a fork server that has imported pydicom and the recognizers and
+    validators once, so each worker is forked from it ready to go rather than importing it all again.
+    '''
+    if get_start_method() == 'fork' or 'forkserver' not in get_all_start_methods(): return None
+    context = get_context('forkserver')
+    context.set_forkserver_preload(list(_preload))
+    return context
+
+
 def validate_pool(
     directory: str, recognizer_name: str, args: argparse.Namespace, concurrency: int, file_generator) -> tuple[str, int]:
     '''Validate the DICOM files in the given directory using a pool of workers.
@@ -236,6 +352,7 @@ def validate_pool(
     Returns:
         Tuple of (database_path, total_findings_count)
     '''
+    global _prebuilt_recognizer
     args_dict = vars(args)
     
     # Create a temporary SQLite database for findings
@@ -246,24 +363,36 @@ def validate_pool(
     
     # Create the database schema
     _create_findings_db(db_path)
-    
+
+    # Forked workers start with a copy of this process, so make the recognizer once here and let them share
+    # its pages copy-on-write instead of each loading its own
+    context = _pool_context()
+    if context is None and get_start_method() == 'fork':
+        _prebuilt_recognizer = PHI_PII_RECOGNIZERS[recognizer_name](args)
+
     try:
         with ProcessPoolExecutor(
             max_workers=concurrency,
+            mp_context=context,
             initializer=_init_worker,
             initargs=(recognizer_name, args_dict, db_path),
         ) as executor:
-            futures = (executor.submit(_scan_one, p) for p in file_generator())
+            # A forking pool starts all its workers on the first job it gets, and each one inherits whatever locks
+            # this process's threads hold at that moment. Give it that job now, before the walk and the Solr
+            # queries start their threads, so the workers fork from a process that has just the one thread
+            executor.submit(_warm_up).result()
+
+            # Hand files to the workers in chunks rather than one future per file to cut down on IPC round trips
             total_findings = 0
             try:
-                for future in as_completed(futures, timeout=None):
-                    count = future.result()
+                for count in executor.map(_scan_one, file_generator(), chunksize=_chunksize):
                     total_findings += count
             except KeyboardInterrupt:
                 # executor will clean up children on context exit
                 pass
         
         _logger.info('📊 Processed %d findings, stored in database', total_findings)
+        _index_findings_db(db_path)
         return db_path, total_findings
     except Exception as ex:
         # Clean up database on error
@@ -295,55 +424,80 @@ def _create_non_solr_paths_iterator(directory: str):
 
     def _iterate() -> Iterable[PotentialFile]:
         for path in iterate_paths(directory):
-            yield PotentialFile(path)
+            yield PotentialFile.get(path)
     return _iterate
 
 
-def _create_solr_paths_iterator(solr_url: str, directory: str, batch_size: int = 100):
-    '''Create a function that iterates over the paths in the given directory using the given Solr URL.'''
+def _solr_session() -> requests.Session:
+    '''Make an HTTP session for Solr queries that keeps a kept-alive connection for each query in flight.
+
+    Requests already asks for gzip-compressed responses, so there's nothing to add for that.
+    '''
+    session = requests.Session()
+    session.stream, session.verify = False, False  # What pysolr would set up for its own session
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_solr_queries_in_flight)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _create_solr_paths_iterator(solr_url: str, directory: str, batch_size: int = 500):
+    '''Create a function that iterates over the paths in the given directory using the given Solr URL.
+
+    The iteration walks the directory and checks the files against Solr a batch at a time, handing out
+    each batch's published files as soon as its query comes back. A few queries run ahead on threads
+    while the walk and the scan carry on.
+    '''
     _logger.info('🔍 Creating Solr paths iterator for %s with batch size %d', directory, batch_size)
 
-    def _collect_existing_paths(solr: pysolr.Solr, ids_to_paths: dict[str, str]) -> set[PotentialFile]:
+    def _collect_existing_paths(solr: pysolr.Solr, ids_to_paths: dict[str, str]) -> list[PotentialFile]:
         if not ids_to_paths:
-            return set()
-        # Build a single query that checks all IDs in this batch
-        quoted_ids = ' OR '.join(f'"{file_id}"' for file_id in ids_to_paths.keys())
-        query = f'id:({quoted_ids})'
+            return []
+        # Build a single query that checks all IDs in this batch; the terms parser looks them up as a set instead
+        # of parsing a big boolean query, but needs a separator that's in none of the IDs
+        if not any(_solr_terms_separator in file_id for file_id in ids_to_paths):
+            query = f'{{!terms f=id separator="{_solr_terms_separator}"}}' + _solr_terms_separator.join(ids_to_paths)
+        else:
+            quoted_ids = ' OR '.join(f'"{file_id}"' for file_id in ids_to_paths.keys())
+            query = f'id:({quoted_ids})'
         results = solr.search(query, rows=len(ids_to_paths), fl=['id', 'eventID', 'BlindedSiteID'])
-        existing_paths: set[PotentialFile] = set()
+        existing_paths: list[PotentialFile] = []
         for doc in results.docs:
             doc_id, event_id, site_id = doc.get('id'), doc.get('eventID', ['«unknown event»'])[0], doc.get('BlindedSiteID', ['«unknown site»'])[0]
             if isinstance(doc_id, list):
                 doc_id = doc_id[0] if doc_id else None
             if doc_id and doc_id in ids_to_paths:
-                existing_paths.add(PotentialFile(ids_to_paths[doc_id], site_id=site_id, event_id=event_id))
+                existing_paths.append(PotentialFile.get(ids_to_paths.pop(doc_id), site_id=site_id, event_id=event_id))
         return existing_paths
 
-    collection_name = os.path.basename(directory)
-    solr = pysolr.Solr(solr_url, verify=False)
-    paths: set[PotentialFile] = set()
-    batch: dict[str, str] = {}
-
-    # First pass to populate `paths` with files both in the filesystem and in Solr
-    for path in iterate_paths(directory):
-        try:
-            collection_index = path.index(collection_name)
-        except ValueError:
-            _logger.debug('⚠️ Skipping %s because it does not contain collection name %s', path, collection_name)
-            continue
-        file_id = path[collection_index:]
-        batch[file_id] = path
-        if len(batch) >= batch_size:
-            paths.update(_collect_existing_paths(solr, batch))
-            batch.clear()
-
-    # Pick up any remaining files in the last batch
-    if batch: paths.update(_collect_existing_paths(solr, batch))
+    # Solr IDs start at the collection's folder. Every path the walk gives starts with `directory`, which ends
+    # with that folder, so the collection name is at the same place in every one of them
+    collection_index = directory.find(os.path.basename(directory))
 
-    _logger.info('🔍 Found %d paths in both the filesystem at %s and in Solr %s', len(paths), directory, solr_url)
     def _iterate() -> Iterable[PotentialFile]:
-        for path in paths:
-            yield path
+        solr, count = pysolr.Solr(solr_url, verify=False, session=_solr_session()), 0
+        pending: deque[Future] = deque()
+        batch: dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=_solr_queries_in_flight) as executor:
+            for path in iterate_paths(directory):
+                batch[path[collection_index:]] = path
+                if len(batch) >= batch_size:
+                    pending.append(executor.submit(_collect_existing_paths, solr, batch))
+                    batch = {}
+                    # Hand out the oldest batch's files once enough queries are running ahead
+                    if len(pending) >= _solr_queries_in_flight:
+                        existing = pending.popleft().result()
+                        count += len(existing)
+                        yield from existing
+
+            # Pick up any remaining files in the last batch, then whatever's still in flight
+            if batch: pending.append(executor.submit(_collect_existing_paths, solr, batch))
+            while pending:
+                existing = pending.popleft().result()
+                count += len(existing)
+                yield from existing
+
+        _logger.info('🔍 Found %d paths in both the filesystem at %s and in Solr %s', count, directory, solr_url)
     return _iterate
 
 
@@ -381,6 +535,10 @@ def main():
         '-f', '--findings-db',
         help='Path to SQLite database of findings; if given the scan is skipped and this database is used instead to report on'
     )
+    parser.add_argument(
+        '-b', '--ignore-burned-in-flag', dest='trust_burned_in_flag', action='store_false',
+        help='OCR pixels even of files whose BurnedInAnnotation says there is none (by default, those are skipped)'
+    )
     parser.add_argument('directory', nargs='?', help='Directory to scan for DICOM files')
     args = parser.parse_args()
     logging.basicConfig(level=args.loglevel, format='%(levelname)s %(message)s')
@@ -4,23 +4,35 @@
 
 from .._classes import PHI_PII_Recognizer, Finding, HeaderFinding, ImageFinding, ErrorFinding, PotentialFile
 from ..const import IMAGE_SCORE
-from collections import Counter
+from collections import Counter, OrderedDict
 from PIL import Image
 from pydicom import datadict
+from pydicom.multival import MultiValue
+from pydicom.valuerep import PersonName
 from typing import Iterable
-import pydicom, logging, argparse, re, pytesseract, math
+import pydicom, logging, argparse, re, pytesseract, math, os, tempfile, hashlib, functools
 
 # Avoid problematic DICOM files so we can still grab as many of the tags and values as we can
 pydicom.config.convert_wrong_length_to_UN = True
 
 _logger = logging.getLogger(__name__)
+_ocr_cache: OrderedDict = OrderedDict()  # Recent OCR results by frame key, oldest first
+_ocr_cache_size = 4096                  # How many frames' OCR results to keep per process
+_textify_cache_size = 8192              # How many distinct values' text to keep per recognizer
+_cacheable_value_types = frozenset((str, bytes, PersonName))  # Value types whose text we keep
+
+# The data dictionary lookup costs a few dict probes and a Tag conversion, and the same tags come up in every file
+_keyword_for_tag = functools.lru_cache(maxsize=4096)(datadict.keyword_for_tag)
 
 
 class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
     '''A simple scoring PHI/PII recognizer.'''
 
     description = 'Simple scoring PHI/PII recognizer uses patterns in certain well-known tags and in pixels to detect PHI/PII'
+    needs_pixels = True  # OCR of burned-in annotations needs the pixel data
+    reads_header = True  # Every tag's value gets a look
     _max_normalized_string = 5000  # How many characters to limit when textifying DICOM metadata tag values
+    _max_ocr_width = 1024          # Frames wider than this many pixels get scaled down before OCR
 
     # Tags that are *genuinely risky by semantics* (person identifiers & clinician names)
     _strict_tags = {
@@ -60,6 +72,13 @@ class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
         (0x0020, 0x4000),  # ImageComments
     }
 
+    # The above as packed (group << 16) | element integers, which is what a pydicom Tag already is, so checking
+    # a tag against them needs no tuple building
+    _strict_tag_ints = frozenset((group << 16) | element for group, element in _strict_tags)
+    _medium_tag_ints = frozenset((group << 16) | element for group, element in _medium_tags)
+    _contextual_low_risk_tag_ints = frozenset((group << 16) | element for group, element in _contextual_low_risk_tags)
+    _institution_name_tag = 0x00080080
+
     # Common regexes for de-identified text values
     _anonymized_patterns = [
         re.compile(r'^(ANON|ANONYMOUS|REDACTED|REMOVED|UNKNOWN|N/A|null|NA)$', re.IGNORECASE),
@@ -72,6 +91,13 @@ class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
         r'\b(AXIAL|CORONAL|SAGITTAL|T1|T2|FLAIR|AX|COR|SAG|SE|GRE|B\-VALUE|ADC)\b', re.IGNORECASE
     )
     
+    # Runs of non-alphanumerics and of whitespace, for normalizing text to compare against the vendor allow list
+    _non_alphanumerics = re.compile(r'[^A-Za-z0-9]+')
+    _whitespace = re.compile(r'\s+')
+
+    # A textified value only counts as text if it has one of these
+    _textual_signal = re.compile(r'[A-Za-z@^]')
+
     # VRs (value representations) that commonly carry free text
     _free_text_VRs = {'AE', 'AS', 'CS', 'LO', 'LT', 'PN', 'SH', 'ST', 'UC', 'UT', 'UR'}
 
@@ -90,6 +116,20 @@ class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
         'URL': re.compile(r'\bhttps?://[^\s]+', re.IGNORECASE),
     }
 
+    # The same as (key, pattern) pairs, with and without NAME_like, for walking them in order without dict views
+    _pattern_items = tuple(_patterns.items())
+    _pattern_items_but_name_like = tuple((key, rx) for key, rx in _pattern_items if key != 'NAME_like')
+
+    # All of the above fused into one alternation, with and without NAME_like, so a single search can rule out
+    # every pattern for the candidates that match none of them—which is nearly all of them
+    _any_pattern = re.compile('|'.join(
+        f'(?i:{rx.pattern})' if rx.flags & re.IGNORECASE else f'(?:{rx.pattern})' for rx in _patterns.values()
+    ))
+    _any_pattern_but_name_like = re.compile('|'.join(
+        f'(?i:{rx.pattern})' if rx.flags & re.IGNORECASE else f'(?:{rx.pattern})'
+        for key, rx in _patterns.items() if key != 'NAME_like'
+    ))
+
     # We don't treat institition names as PHI/PII; flip this if necessary
     _suppress_institution_names = True
 
@@ -125,6 +165,9 @@ class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
     def __init__(self, args: argparse.Namespace):
         '''Initialize the recognizer with the given arguments.'''
         self.score = args.score
+        self._base_scores: dict[tuple[pydicom.tag.Tag, str | None, str | None], float] = {}
+        self._cached_textify_scalar = functools.lru_cache(maxsize=_textify_cache_size, typed=True)(self._textify_scalar)
+        self.trust_burned_in_flag = getattr(args, 'trust_burned_in_flag', True)
 
     def _extract_frames(self, ds: pydicom.Dataset, max_frames: int = 4) -> list:
         '''Extract up to `max_frames` frames from the given DICOM dataset.'''
@@ -144,11 +187,13 @@ class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
                     # There could be hundreds of frames, so we get evenly spaced ones with a step size
                     step = max(1, arr.shape[0] // max_frames)  ## step size with larger of 1 and floor division
                     frame_indexes = list(range(0, arr.shape[0], step))[:max_frames]
-                    for i in frame_indexes:
-                        if arr.shape[-1] in (3, 4):  # RGB(A)
-                            frames.append(Image.fromarray(arr))
-                            break
-                        frames.append(Image.fromarray(arr[i]))
+                    if arr.shape[-1] in (3, 4):  # RGB(A)
+                        frames.append(Image.fromarray(arr))
+                    else:
+                        # Gather the chosen frames into one contiguous block with a single indexing operation
+                        # rather than handing PIL strided views into the whole (possibly huge) array
+                        chosen = arr[frame_indexes]
+                        frames.extend(Image.fromarray(frame) for frame in chosen)
                 else:
                     if arr.shape[-1] in (3, 4):  # RGB(A)
                         frames.append(Image.fromarray(arr))
@@ -169,9 +214,12 @@ class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
         for f in frames:
             try:
                 if f.mode not in ('L', 'RGB'):
-                    normalized.append(f.convert('L'))  # L = lumincance (grayscale)
-                else:
-                    normalized.append(f)
+                    f = f.convert('L')  # L = lumincance (grayscale)
+                if f.width > self._max_ocr_width:
+                    # Tesseract's time goes with the pixel count, and burned-in text stays legible at this width
+                    height = max(1, round(f.height * self._max_ocr_width / f.width))
+                    f = f.resize((self._max_ocr_width, height), Image.LANCZOS)
+                normalized.append(f)
             except Exception:
                 continue
 
@@ -198,8 +246,84 @@ class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
             except Exception:
                 return '', []   
 
+    def _frame_key(self, frame: Image.Image) -> bytes:
+        '''Make a key for the OCR cache from the given frame's mode, size, and pixels.'''
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f'{frame.mode}:{frame.width}x{frame.height}:'.encode('ascii'))
+        digest.update(frame.tobytes())
+        return digest.digest()
+
+    def _recognize_all_characters(self, frames: list[Image.Image]) -> list[tuple[str, list[tuple[int, int, int, int]]]]:
+        '''Recognize characters in all the given frames using OCR, reusing what we've already recognized.
+
+        A series often repeats the same banner or burned-in header across hundreds of images, so we keep
+        the most recent OCR results by frame content and only send tesseract the frames we haven't seen.
+        '''
+        keys = [self._frame_key(frame) for frame in frames]
+        results, missing = [], {}
+        for key, frame in zip(keys, frames):
+            result = _ocr_cache.get(key)
+            if result is None:
+                missing.setdefault(key, frame)
+            else:
+                _ocr_cache.move_to_end(key)
+            results.append(result)
+        if missing:
+            for key, result in zip(missing, self._ocr_frames(list(missing.values()))):
+                _ocr_cache[key] = result
+            while len(_ocr_cache) > _ocr_cache_size: _ocr_cache.popitem(last=False)
+            results = [_ocr_cache[key] if result is None else result for key, result in zip(keys, results)]
+        return results
+
+    def _ocr_frames(self, frames: list[Image.Image]) -> list[tuple[str, list[tuple[int, int, int, int]]]]:
+        '''Recognize characters in all the given frames using OCR.
+
+        Each call to pytesseract starts a fresh tesseract process and loads its models, so rather than pay
+        that for every frame, we write the frames out and hand tesseract a list of them, then split its
+        output back up by page. If that goes wrong or there's only the one frame, we do it frame by frame.
+        '''
+        if len(frames) < 2: return [self._recognize_characters(frame) for frame in frames]
+        try:
+            with tempfile.TemporaryDirectory() as scratch:
+                paths = []
+                for idx, frame in enumerate(frames):
+                    path = os.path.join(scratch, f'{idx}.png')
+                    frame.save(path)
+                    paths.append(path)
+                frame_list = os.path.join(scratch, 'frames.txt')
+                with open(frame_list, 'w') as io:
+                    io.write('\n'.join(paths) + '\n')
+                data = pytesseract.image_to_data(frame_list, output_type=pytesseract.Output.DICT)
+        except Exception:
+            return [self._recognize_characters(frame) for frame in frames]
+
+        texts: list[list[str]] = [[] for _ in frames]
+        boxes: list[list[tuple[int, int, int, int]]] = [[] for _ in frames]
+        for page, txt, x, y, w, h in zip(
+            data['page_num'], data['text'], data['left'], data['top'], data['width'], data['height']
+        ):
+            txt = (txt or '').strip()
+            if not txt or not 1 <= page <= len(frames): continue
+            texts[page - 1].append(txt)
+            boxes[page - 1].append((x, y, w, h))
+        return [(''.join(t), b) for t, b in zip(texts, boxes)]
+
+    def _declares_no_burned_in_text(self, potential_file: PotentialFile) -> bool:
+        '''Tell if the given file says its pixels have no burned-in annotation or recognizable features.
+
+        BurnedInAnnotation (0028,0301) is the standard's own statement about text in the pixels; we only take
+        its word when RecognizableVisualFeatures (0028,0302) doesn't say otherwise.
+        '''
+        ds = potential_file.dcmread(stop_before_pixels=True, force=False)
+        burned_in = str(ds.get('BurnedInAnnotation', '') or '').strip().upper()
+        recognizable = str(ds.get('RecognizableVisualFeatures', '') or '').strip().upper()
+        return burned_in == 'NO' and recognizable != 'YES'
+
     def _recognize_pixels(self, potential_file: PotentialFile) -> list[Finding]:
         '''Recognize PHI/PII in the pixels of the given DICOM dataset.'''
+        if self.trust_burned_in_flag and self._declares_no_burned_in_text(potential_file):
+            _logger.debug('🙈 Skipping OCR of %s since it declares no burned-in annotation', potential_file)
+            return []
         ds, findings, frames = potential_file.dcmread(stop_before_pixels=False, force=False, cache=False), [], []
         try:
             frames = self._extract_frames(ds)
@@ -209,8 +333,7 @@ class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
                 file=potential_file, value='💥 Unexpected exception extracting pixel frames', error_message=str(ex)
             ))
         if not frames: return findings
-        for idx, frame in enumerate(frames):
-            text, boxes = self._recognize_characters(frame)        
+        for idx, (text, boxes) in enumerate(self._recognize_all_characters(frames)):
             if not text: continue
             for key, rx in self._patterns.items():
                 for m in rx.finditer(text):
@@ -228,7 +351,7 @@ class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
         This is a simple normalization that removes whitespace and punctuation,
         and converts to uppercase.
         '''
-        return re.sub(r'\s+', ' ', re.sub(r'[^A-Za-z0-9]+', ' ', s or '')).strip().upper()
+        return self._whitespace.sub(' ', self._non_alphanumerics.sub(' ', s or '')).strip().upper()
 
     def _displayable_str(self, v, max_length: int = 80) -> str:
         '''Return a string version of `v` and limit it to `max_length` characters.'''
@@ -241,71 +364,74 @@ class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
     ) -> Iterable[tuple[str, str, str, pydicom.tag.Tag]]:
         '''Iterate over all elements in the given DICOM dataset.
         
-        This yields tuples of (path, value, value representation, tag).
+        This yields tuples of (path, value, value representation, tag), descending into the items of
+        sequences depth first. It keeps its own stack of the datasets it's partway through rather than
+        recursing, so deeply nested structured reports cost no extra Python frames.
         '''
-        for elem in ds.iterall():
-            t = pydicom.tag.Tag(elem.tag)
-            vr = elem.VR if hasattr(elem, 'VR') else None
-            name = elem.keyword or elem.name or f'{t.group:04x}{t.element:04x}'
-            path = f'{path_prefix}.{name}' if path_prefix else name
-            if vr == 'SQ':
-                # Recurse into sequences
-                for idx, item in enumerate(elem.value or []):
-                    sub_prefix = f'{path}[{idx}]'
-                    yield from self._iter_over_dicom_elements(item, sub_prefix)
-            else:
+        stack = [(iter(ds), path_prefix)]
+        while stack:
+            elements, prefix = stack[-1]
+            for elem in elements:
+                t = elem.tag
+                vr = elem.VR if hasattr(elem, 'VR') else None
+                name = elem.keyword or elem.name or f'{t.group:04x}{t.element:04x}'
+                path = f'{prefix}.{name}' if prefix else name
+                if vr == 'SQ':
+                    # Descend into the sequence's items and come back to the rest of this dataset afterwards
+                    stack.extend(
+                        (iter(item), f'{path}[{idx}]') for idx, item in reversed(list(enumerate(elem.value or [])))
+                    )
+                    break
                 yield path, elem.value, vr, t
+            else:
+                stack.pop()
 
     def _normalize_text(self, s: str) -> str:
         '''Normalizes a string by removing null bytes, stripping, and truncating.'''
         s = (s or '').replace('\x00', '').strip()
         return s[:self._max_normalized_string] if len(s) > self._max_normalized_string else s
 
+    def _textify_scalar(self, x) -> str:
+        '''Extract human text from a single, non-sequence DICOM value, or the empty string if there's none.'''
+        if isinstance(x, (bytes, bytearray)):
+            try: s = x.decode(errors='ignore')
+            except Exception: return ''
+            return self._normalize_text(s)
+
+        if isinstance(x, str):
+            return self._normalize_text(x)
+
+        # --- Scalar / object fallback ---
+        # pydicom PN class names vary by version; don’t rely on exact class.
+        # If stringified value looks like text (letters or caret), keep it.
+        try: s = self._normalize_text(str(x))
+        except Exception: return ''
+
+        # Keep only if it contains textual signal (avoid plain numbers & empty reprs)
+        return s if s and self._textual_signal.search(s) else ''
+
     def _textify(self, obj) -> list[str]:
         '''Recursively extract human text from common DICOM value shapes.'''
         out: list[str] = []
+        textify_scalar = self._cached_textify_scalar
 
         def _recurse(x):
             if x is None: return
-            # Lazy imports, tolerate version differences
-            try: from pydicom.multival import MultiValue
-            except Exception: MultiValue = tuple()  # type: ignore
-
-            if isinstance(x, (bytes, bytearray)):
-                try: s = x.decode(errors='ignore')
-                except Exception: return
-                s = self._normalize_text(s)
-                if s: out.append(s)
-                return
-
-            if isinstance(x, str):
-                s = self._normalize_text(x)
-                if s: out.append(s)
-                return
 
             if isinstance(x, (list, tuple, set, MultiValue)):
                 for item in x: _recurse(item)
                 return
 
-            # --- Scalar / object fallback ---
-            # pydicom PN class names vary by version; don’t rely on exact class.
-            # If stringified value looks like text (letters or caret), keep it.
-            try: s = self._normalize_text(str(x))
-            except Exception: return
-
-            # Keep only if it contains textual signal (avoid plain numbers & empty reprs)
-            if s and re.search(r'[A-Za-z@^]', s): out.append(s)
-            # else: ignore numbers/UIDs/etc.
+            # The same values (modalities, manufacturers, names) come up file after file, so reuse the text from
+            # last time for the types whose equal values always give equal text
+            s = textify_scalar(x) if type(x) in _cacheable_value_types else self._textify_scalar(x)
+            if s: out.append(s)
 
         _recurse(obj)
 
-        # Deduplicate while preserving order
-        seen, uniq = set(), []
-        for s in out:
-            if s not in seen:
-                seen.add(s)
-                uniq.append(s)
-        return uniq
+        # Deduplicate while preserving order; most values are a single scalar, which has nothing to deduplicate
+        if len(out) <= 1: return out
+        return list(dict.fromkeys(out))
 
     def _high_entropy(self, s: str) -> bool:
         '''Return True if the string has high entropy, False otherwise.
@@ -315,9 +441,11 @@ class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
         '''
         if not s or len(s) < 3: return False
         
-        # Calculate Shannon entropy
+        # High entropy needs at least 4 unique characters, so don't bother with the logarithms for fewer
         char_counts = Counter(s)
-        
+        if len(char_counts) < 4: return False
+
+        # Calculate Shannon entropy
         entropy = 0.0
         length = len(s)
         for count in char_counts.values():
@@ -326,38 +454,29 @@ class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
         
         # Normalize by maximum possible entropy (log2 of unique chars)
         max_entropy = math.log2(len(char_counts))
-        if max_entropy == 0: return False
+        normalized_entropy = entropy / max_entropy
         
-        normalized_entropy = entropy / max_entropy if max_entropy > 0 else 0
-        
-        # High entropy threshold: > 0.85 and at least 4 unique characters
-        return normalized_entropy > 0.85 and len(char_counts) >= 4
+        # High entropy threshold: > 0.85
+        return normalized_entropy > 0.85
 
 
-    def _score(self, tag: pydicom.tag.Tag, vr: str | None, value: any, matched_key: str | None) -> float:
-        '''Heuristic confidence (0..1) that a finding could be PHI/PII.
+    def _base_score(self, tag: pydicom.tag.Tag, vr: str | None, matched_key: str | None) -> float:
+        '''The part of the score that depends only on the tag, VR, and which detector fired.
 
-        Uses:
-        - tag semantics (self._strict_tags vs contextual)
-        - free-text VRs (light)
-        - which detector fired (weighted)
-        - value-level hints (dummy placeholders; modality jargon)
+        These come from small sets and repeat constantly, so the sums are kept by (tag, VR, key) once made.
         '''
-        text = str(value or '').strip()
-
-        for rx in self._anonymized_patterns:
-            if rx.match(text):
-                return 0.1
+        key = (tag, vr, matched_key)
+        score = self._base_scores.get(key)
+        if score is not None: return score
 
         score = 0.1
-        tg = (tag.group, tag.element)
 
         # Tag semantics
-        if tg in self._strict_tags:
+        if tag in self._strict_tag_ints:
             score += 0.6
-        elif tg in self._medium_tags:
+        elif tag in self._medium_tag_ints:
             score += 0.2  # was 0.6 before; now medium unless more evidence
-        elif tg in self._contextual_low_risk_tags:
+        elif tag in self._contextual_low_risk_tag_ints:
             score += 0.0  # super explicit that these don't add risk 😁
 
         # Free-text VRs (value representations)
@@ -372,11 +491,33 @@ class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
                 score += 0.35
             elif matched_key == 'NAME_like':
                 score += 0.2
-                if self._non_person_hints.search(text):
-                    score -= 0.15
             elif matched_key == 'PN_structured':
                 score += 0.30
 
+        self._base_scores[key] = score
+        return score
+
+    def _score(self, tag: pydicom.tag.Tag, vr: str | None, value: any, matched_key: str | None) -> float:
+        '''Heuristic confidence (0..1) that a finding could be PHI/PII.
+
+        Uses:
+        - tag semantics (self._strict_tags vs contextual)
+        - free-text VRs (light)
+        - which detector fired (weighted)
+        - value-level hints (dummy placeholders; modality jargon)
+        '''
+        text = str(value or '').strip()
+
+        for rx in self._anonymized_patterns:
+            if rx.match(text):
+                return 0.1
+
+        score = self._base_score(tag, vr, matched_key)
+
+        # Imaging jargon makes a name-like match less likely to be a person
+        if matched_key == 'NAME_like' and self._non_person_hints.search(text):
+            score -= 0.15
+
         # Added by ChatGPT: PN fields that *don’t* look like names → dampen
         if vr == 'PN' and not (self._pn_structured.match(text) or self._patterns['NAME_like'].search(text)):
             score -= 0.35   # pulls 0.85 → ~0.50
@@ -390,7 +531,7 @@ class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
 
     def _recognize_tags(self, potential_file: PotentialFile) -> list[Finding]:
         '''Recognize PHI/PII in the tags of the given DICOM dataset.'''
-        ds = potential_file.dcmread(stop_before_pixels=True, force=False, cache=False)
+        ds = potential_file.dcmread(stop_before_pixels=True, force=False)
         # Gather all candidate strings from the dataset
         findings: list[Finding] = []
         for path, value, vr, t in self._iter_over_dicom_elements(ds):
@@ -401,11 +542,11 @@ class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
             candidates: list[str] = self._textify(value)
 
             # Skip institution names if we're suppressing them
-            if self._suppress_institution_names and (t.group, t.element) == (0x0008, 0x0080): continue
+            if self._suppress_institution_names and t == self._institution_name_tag: continue
 
             # Auto-flag truly risky tags and only when we have real text
-            if (t.group, t.element) in self._strict_tags:
-                tag_keyword = datadict.keyword_for_tag(t)
+            if t in self._strict_tag_ints:
+                tag_keyword = _keyword_for_tag(t)
                 for c in candidates:
                     c = c.strip()
                     if 'anonymized' in c.lower():
@@ -426,7 +567,7 @@ class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
             # RawDataElement objects don't have a keyword attribute, so use getattr with fallback to datadict
             tag_keyword = getattr(elem, 'keyword', None) if elem is not None else None
             if tag_keyword is None:
-                tag_keyword = datadict.keyword_for_tag(t) or ''
+                tag_keyword = _keyword_for_tag(t) or ''
             else:
                 tag_keyword = tag_keyword or ''
             vendor_context = tag_keyword in self._vendor_safe_tags
@@ -434,6 +575,10 @@ class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
             # Allow name-like patterns where the keyword says it's a name or when value-representation
             # (VR) is explicitly person name (PN)
             allow_name_like_here = (tag_keyword in self._name_like_allowed_tags) or (vr == 'PN')
+            if allow_name_like_here:
+                any_pattern, pattern_items = self._any_pattern, self._pattern_items
+            else:
+                any_pattern, pattern_items = self._any_pattern_but_name_like, self._pattern_items_but_name_like
 
             for c in candidates:
                 if not c.strip(): continue
@@ -449,11 +594,9 @@ class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
                     # Continue here to avoid double-counting with the NAME_like pattern
                     continue
                 
-                # Normal pattern-based detection
-                for key, rx in self._patterns.items():
-                    # Suppress NAME_like in non-person fields entirely
-                    if key == 'NAME_like' and not allow_name_like_here: continue
-
+                # Normal pattern-based detection, once we know at least one of the patterns is there to find
+                if not any_pattern.search(c): continue
+                for key, rx in pattern_items:
                     # If in vendor fields, avoid vendor/manufacturer phrases
                     if key == 'NAME_like' and vendor_context:
                         norm = self._normalize_text_for_match(c)
@@ -470,6 +613,7 @@ class SimpleScoring_PHI_PII_Recognizer(PHI_PII_Recognizer):
         return findings
 
     def recognize(self, potential_file: PotentialFile) -> list[Finding]:
-        findings = self._recognize_tags(potential_file) + self._recognize_pixels(potential_file)
+        findings = self._recognize_tags(potential_file)
+        if self.needs_pixels: findings += self._recognize_pixels(potential_file)
         return findings
 
@@ -19,43 +19,52 @@ Then run this script:
     summarize-validation-reports /labcas-data/labcas-backend/reports/edrn
 '''
 
-from typing import Any
-import argparse, logging, csv, glob, os.path, re
+from typing import Any, Iterator
+import argparse, logging, csv, os, os.path, re, sys
 from collections import defaultdict, Counter
 
 _logger = logging.getLogger(__name__)
+_read_buffer_size = 1 << 20  # Read reports a mebibyte at a time
 _series_removal_re = re.compile(r'\(with the same SeriesInstanceUID [^)]+\)')
 _image_orientation_patient_removal_re = re.compile(r', «[^»]+», ')
 _phi_pii_removal_re = re.compile(r'\), .+$')
 _completeness_and_format_removal_re = re.compile(r'— please review for completeness and format')
 _sample_value_removal_re = re.compile(r'(, )?«[^»]*»,?')
 
+# Both of the above in one pass; neither can match inside the other, so this removes the same text
+_value_and_boilerplate_removal_re = re.compile(
+    f'{_sample_value_removal_re.pattern}|{_completeness_and_format_removal_re.pattern}'
+)
+
+# How to simplify details by the kind of finding…
+_simplifiers_by_finding = {
+    '🙈 Possible PHI/PII in Header': lambda details: _phi_pii_removal_re.sub(") possible PHI/PII in tag's value", details),
+    '👮 Warning': lambda details: 'Warning: ' + details,
+    '🖼️ Possible Burned-in PHI/PII (Pixels)': lambda details: 'Possible burned-in PHI/PII (pixels)',
+}
+
+# …and otherwise by the tag the details start with
+_tag_prefix_length = len('(gggg,eeee)')
+_simplifiers_by_tag = {
+    '(0018,0088)': lambda details: _series_removal_re.sub('', details),
+    '(0020,0037)': lambda details: _image_orientation_patient_removal_re.sub('', details),
+}
+
+
 def _simplify_issue(finding, details: str) -> str:
     '''Simplify the issue description.
 
     The detailed reports in the input `.csv` files are verbose; we want to simplify the findings
     for the summary and to coalesce similar findings into a single issue.
     '''
-
-    if finding == '🙈 Possible PHI/PII in Header':
-        details = _phi_pii_removal_re.sub(") possible PHI/PII in tag's value", details)
-    elif finding == '👮 Warning':
-        details = 'Warning: ' + details
-    elif finding == '🖼️ Possible Burned-in PHI/PII (Pixels)':
-        details = 'Possible burned-in PHI/PII (pixels)'
-    elif details.startswith('(0018,0088)'):
-        details = _series_removal_re.sub('', details)
-    elif details.startswith('(0020,0037)'):
-        details = _image_orientation_patient_removal_re.sub('', details)
-
+    simplifier = _simplifiers_by_finding.get(finding) or _simplifiers_by_tag.get(details[:_tag_prefix_length])
+    if simplifier is not None: details = simplifier(details)
 
     # Remove any found values so `(0008,0008) (ImageType), «Blah blah», Failed core…` and
-    # `(0008,0008) (ImageType), «Goober goober», Failed core…` are treated the same
-    details = _sample_value_removal_re.sub('', details)
-
-    # Remove the utterly useless "please review for completeness and format" text that appears on
-    # every single issue … le sigh!
-    details = _completeness_and_format_removal_re.sub('', details)
+    # `(0008,0008) (ImageType), «Goober goober», Failed core…` are treated the same, and also
+    # remove the utterly useless "please review for completeness and format" text that appears on
+    # every single issue … le sigh!
+    details = _value_and_boilerplate_removal_re.sub('', details)
 
     return details.strip()
 
@@ -68,10 +77,24 @@ def _unique_file_name(collection: str, site: str, event: str, file_name: str) ->
     return f'{collection}/{site}/{event}/{file_name}'
 
 
-def _get_collection_and_site_and_event_from_file_name(file_name: str) -> str:
-    '''Get the collection and site from the file name.'''
-    splatted = file_name.split('/')
-    return f'{splatted[0]}: {splatted[1]}: {splatted[2]}'
+def _describe_event(event: tuple[str, str, str]) -> str:
+    '''Describe the given (collection, site, event) triple.'''
+    return '{}: {}: {}'.format(*event)
+
+
+def _iterate_reports(report_directory: str) -> Iterator[tuple[str, str]]:
+    '''Iterate over the collection names and paths of the `.csv` reports in each collection's folder.
+
+    This finds the same files as the `*/*.csv` glob, including skipping hidden ones, but gets each entry's
+    type from the directory listing rather than checking each path.
+    '''
+    with os.scandir(report_directory) as collections:
+        for collection in collections:
+            if collection.name.startswith('.') or not collection.is_dir(): continue
+            with os.scandir(collection.path) as reports:
+                for report in reports:
+                    if report.name.startswith('.') or not report.name.endswith('.csv'): continue
+                    yield collection.name, report.path
 
 
 def _summarize_reports(report_directory: str, output: str):
@@ -80,21 +103,26 @@ def _summarize_reports(report_directory: str, output: str):
     issue_by_files: defaultdict[str, set[str]] = defaultdict(set)
     issue_by_collection: defaultdict[str, set[str]] = defaultdict(set)
     issue_by_site: defaultdict[str, set[str]] = defaultdict(set)
+    issue_by_event: defaultdict[str, set[tuple[str, str, str]]] = defaultdict(set)
     # per_event_counts: defaultdict[str, Counter] = defaultdict(Counter)
     # total_events = total_files = total_findings = 0
-    for report_file in glob.iglob(f'{report_directory}/*/*.csv'):
-        collection = os.path.basename(os.path.dirname(report_file))
-        with open(report_file, 'r', newline='') as io:
+    for collection, report_file in _iterate_reports(report_directory):
+        collection = sys.intern(collection)
+        with open(report_file, 'r', newline='', buffering=_read_buffer_size) as io:
             reader = csv.reader(io)
+            next(reader, None)  # Skip the "Site ID, Event ID, …" header
             for row in reader:
-                if row[0] == 'Site ID': continue
                 site, event, file_name, score, finding, details = row
+
+                # The same few sites, events, and issues repeat on row after row, so keep one copy of each
+                site, event = sys.intern(site), sys.intern(event)
                 unique_file_name = _unique_file_name(collection, site, event, file_name)
                 all_files.add(unique_file_name)
-                issue = _simplify_issue(finding, details)
+                issue = sys.intern(_simplify_issue(finding, details))
                 issue_by_files[issue].add(unique_file_name)
                 issue_by_collection[issue].add(collection)
                 issue_by_site[issue].add(site)
+                issue_by_event[issue].add((collection, site, event))
     assert len(issue_by_collection) == len(issue_by_files) == len(issue_by_site)
 
     with open(output, 'w', newline='') as io:
@@ -106,7 +134,7 @@ def _summarize_reports(report_directory: str, output: str):
         for issue in sorted(issue_by_site.keys()):
             sites, collections, files = issue_by_site[issue], issue_by_collection[issue], issue_by_files[issue]
             collections = ', '.join(sorted(collections))
-            col_sites = '; '.join(sorted(set([_get_collection_and_site_and_event_from_file_name(file) for file in files])))
+            col_sites = '; '.join(sorted({_describe_event(event) for event in issue_by_event[issue]}))
             percentage = f'{len(files) / len(all_files):.2%}'
             writer.writerow([issue, len(files), percentage, collections, len(sites), col_sites])
 
@@ -39,7 +39,8 @@ from ._core import (
     SliceThicknessValidator,
     FrameOfReferenceUIDValidator,
 )
-from ._mr import SpacingBetweenSlicesValidator
+from ._mr import SpacingBetweenSlicesValidator, share_sibling_reads  # noqa: F401
+from .._classes import Validator
 
 VALIDATORS = [
     # These are experimental validators for testing and development purposes and should not be used in production:
@@ -80,3 +81,8 @@ VALIDATORS = [
     FrameOfReferenceUIDValidator(),
     SpacingBetweenSlicesValidator(),
 ]
+
+# Validators only ever look at a few dozen tags, so read just those—once per file, shared by all of them
+Validator.header_tags = tuple(sorted({
+    tag for validator in VALIDATORS for tag in (validator.tag, *validator.required_tags)
+}))
@@ -4,13 +4,17 @@
 
 from .._classes import Validator, ValidationFinding, PotentialFile, WarningFinding
 from .._functions import textify_dicom_value
-from pydicom.dataelem import convert_raw_data_element
+from pydicom.dataelem import convert_raw_data_element, RawDataElement
 import re, pydicom, logging
 from pydicom import datadict
 from typing import ClassVar
 
 _logger = logging.getLogger(__name__)
 
+# Text VRs whose empty or all-space raw value always converts to a blank one; numeric VRs like DS and IS don't
+# (an empty one becomes None, which textifies as "None"), and binary ones can be all 0x20 bytes on purpose
+_blank_means_missing_VRs = frozenset(('AE', 'AS', 'CS', 'DA', 'DT', 'LO', 'LT', 'PN', 'SH', 'ST', 'TM', 'UC', 'UI', 'UR', 'UT'))
+
 
 class RegexValidator(Validator):
     '''An abstract base class for validators that check a regex pattern against a value.
@@ -24,27 +28,31 @@ class RegexValidator(Validator):
         '''Override to enforce our own requirements without calling parent check.'''
         # Don't call super().__init_subclass__() - we'll enforce our own requirements
         # We require description, tag, AND regex for concrete subclasses
-        if cls.__name__ in ('DICOMUIDValidator', 'YMDValidator', 'CaseInsensitiveAndWarningRegexValidator'):
+        if cls.__name__ in (
+            'DICOMUIDValidator', 'YMDValidator', 'CaseInsensitiveAndWarningRegexValidator', 'ControlledVocabularyValidator'
+        ):
             return
 
-        import inspect
-        # Check if this subclass is abstract (has abstract methods)
-        abstract_methods = [
-            name for name, method in inspect.getmembers(cls, predicate=inspect.isfunction)
-            if getattr(method, '__isabstractmethod__', False)
-        ]
-        if not abstract_methods:  # Only check concrete classes
+        if not cls._is_abstract():  # Only check concrete classes
             for attr in ('description', 'tag', 'regex'):
                 if not hasattr(cls, attr):
                     raise TypeError(f'{cls.__name__} must define a «{attr}» class attribute')
 
+        # Case-insensitive validators fall back on the same pattern without regard to case, so compile it once now,
+        # and name their tag in warnings, so look that up once too
+        if issubclass(cls, CaseInsensitiveAndWarningRegexValidator):
+            if 'regex' in vars(cls):
+                cls._case_insensitive_regex = re.compile(cls.regex.pattern, cls.regex.flags | re.IGNORECASE)
+            if 'tag' in vars(cls):
+                cls._tag_keyword = datadict.keyword_for_tag(cls.tag) if cls.tag else 'unknown tag'
+
     def _match_pattern(self, value: str):
         '''Match the given value against our regex pattern.'''
         return self.regex.match(value)
 
     def validate(self, potential_file: PotentialFile) -> list[ValidationFinding]:
         '''Validate the given DICOM dataset `potential_file` against our regex pattern and return the findings.'''
-        ds = potential_file.dcmread(stop_before_pixels=True, force=False)
+        ds = self.dcmread(potential_file)
         findings: list[ValidationFinding] = []
         elem = ds.get_item(self.tag)
         if elem is None:
@@ -53,25 +61,29 @@ class RegexValidator(Validator):
                 description=f'Required tag not found in DICOM dataset'
             ))
         else:
-            try:
-                elem = convert_raw_data_element(elem) 
-            except AttributeError as ex:
-                # Use elem directly as it is already a DataElement
-                pass
-            value = textify_dicom_value(elem.value)
+            # Only raw elements need converting; anything else is already a DataElement. A blank raw text value
+            # is missing however it converts, so don't bother converting and textifying it
+            if isinstance(elem, RawDataElement) and elem.VR in _blank_means_missing_VRs and not (elem.value or b'').strip():
+                value = []
+            else:
+                if isinstance(elem, RawDataElement): elem = convert_raw_data_element(elem)
+                value = textify_dicom_value(elem.value)
             if not value or not any(v.strip() for v in value):
                 findings.append(ValidationFinding(
                     file=potential_file, value='value missing', tag=self.tag,
                     description=f'Tag found but missing a value in DICOM dataset'
                 ))
             else:
+                # Every value of every file comes through here, so don't even build the log arguments unless debugging
+                debugging = _logger.isEnabledFor(logging.DEBUG)
                 for v in value:
                     v = v.strip()
                     if not v: continue
-                    _logger.debug(
-                        '🫆 Class %s checking value «%s» for tag %s in %s',
-                        self.__class__.__name__, v, self.tag, potential_file
-                    )
+                    if debugging:
+                        _logger.debug(
+                            '🫆 Class %s checking value «%s» for tag %s in %s',
+                            self.__class__.__name__, v, self.tag, potential_file
+                        )
                     if not self._match_pattern(v):
                         findings.append(ValidationFinding(
                             file=potential_file, value=v, tag=self.tag,
@@ -95,6 +107,9 @@ class YMDValidator(RegexValidator):
 class CaseInsensitiveAndWarningRegexValidator(RegexValidator):
     '''An abstract validator that checks for a regex pattern and issue warnings.'''
 
+    _case_insensitive_regex: ClassVar[re.Pattern]  # Made from «regex» for each subclass that defines one
+    _tag_keyword: ClassVar[str] = 'unknown tag'    # Made from «tag» for each subclass that defines one
+
     class _CaseMismatchError(Exception):
         '''Indicate that while the value might match the regex, it's doesn't match the letter case.'''
         pass
@@ -106,16 +121,36 @@ class CaseInsensitiveAndWarningRegexValidator(RegexValidator):
         '''
         matches = self.regex.match(value)
         if matches is not None: return matches
-        case_insensitive_regex = re.compile(self.regex.pattern, self.regex.flags | re.IGNORECASE)
-        matches = case_insensitive_regex.match(value)
+        matches = self._case_insensitive_regex.match(value)
         if matches is not None: raise self._CaseMismatchError(value)
 
     def validate(self, potential_file: PotentialFile) -> list[ValidationFinding]:
         try:
             return super().validate(potential_file)
         except self._CaseMismatchError as ex:
-            tag_name = datadict.keyword_for_tag(self.tag) if self.tag else 'unknown tag'
             return [WarningFinding(
                 file=potential_file, value=f'«{ex.args[0]}»', tag=self.tag,
-                description=f'{self.tag} Value for {tag_name} matches expected pattern but uses incorrect case; {self.description}'
+                description=f'{self.tag} Value for {self._tag_keyword} matches expected pattern but uses incorrect case; {self.description}'
             )]
+
+
+class ControlledVocabularyValidator(RegexValidator):
+    '''An abstract validator that checks for one of a fixed set of values.
+
+    Subclasses define «allowed_values» instead of «regex»; a value in the set passes with a single hash
+    lookup. The anchored alternation of those values is made into «regex» for everything else, so mixing
+    in CaseInsensitiveAndWarningRegexValidator still warns about values that differ only in case.
+    '''
+
+    allowed_values: ClassVar[frozenset[str]]  # Subclasses must override with a concrete value
+
+    def __init_subclass__(cls, **kwargs):
+        '''Make the «regex» from the «allowed_values» before the usual checks.'''
+        if 'allowed_values' in vars(cls):
+            cls.regex = re.compile('^(' + '|'.join(re.escape(value) for value in sorted(cls.allowed_values)) + ')$')
+        super().__init_subclass__(**kwargs)
+
+    def _match_pattern(self, value: str):
+        '''Match the given value against our allowed values, falling back on the regex if it's not one.'''
+        if value in self.allowed_values: return True
+        return super()._match_pattern(value)
@@ -9,12 +9,16 @@ https://docs.google.com/spreadsheets/d/1Q56vKzK0nB4UAkfLJnBOy6C-7wtHccvZkWYGQHTM
 
 from .._classes import Validator, ValidationFinding, PotentialFile, WarningFinding
 from .._functions import textify_dicom_value
-from ._base import RegexValidator, DICOMUIDValidator, YMDValidator, CaseInsensitiveAndWarningRegexValidator
-from pydicom.dataelem import convert_raw_data_element
+from ._base import (
+    RegexValidator, DICOMUIDValidator, YMDValidator, CaseInsensitiveAndWarningRegexValidator, ControlledVocabularyValidator
+)
+from pydicom.dataelem import convert_raw_data_element, RawDataElement
 from collections.abc import Sequence
+from typing import ClassVar
 import pydicom, re, logging
 
 _logger = logging.getLogger(__name__)
+_photometric_interpretation_tag = pydicom.tag.Tag((0x0028, 0x0004))  # Looked up on every file by the window validators
 
 
 # Study, Series, and Image Identification
@@ -68,13 +72,17 @@ class SOPClassUIDValidator(DICOMUIDValidator):
 # Acquisition Modality and Equipment
 # ----------------------------------
 
-class ModalityValidator(CaseInsensitiveAndWarningRegexValidator):
+class ModalityValidator(ControlledVocabularyValidator, CaseInsensitiveAndWarningRegexValidator):
     '''A validator that checks the Modality tag.'''
 
     description = 'Modality must be a valid DICOM code (CT, MR, MG, PT, etc.)'
     tag = pydicom.tag.Tag((0x0008, 0x0060))
     # Valid DICOM Modality codes per PS3.3 C.7.3.1.1.1
-    regex = re.compile(r'^(AS|AU|BDUS|BI|BMD|CD|CR|CT|DD|DG|DOC|DX|ECG|EPS|ES|FID|GM|HC|HD|IO|IOL|IVOCT|IVUS|KER|LS|M3D|MG|MR|NM|OAM|OCT|OP|OPM|OPT|OPV|OT|OSS|PR|PT|PX|REG|RESP|RF|RG|RTBrachy|RTDOSE|RTIMAGE|RTIonBeamsTreatmentRecord|RTIonPlan|RTPLAN|RTRECORD|RTRAD|RTSEGANN|RTSTRUCT|RTV|SC|SEG|SM|SMR|SR|SRF|ST|TG|US|VA|XA|XC|XCD)$')
+    allowed_values = frozenset('''
+        AS AU BDUS BI BMD CD CR CT DD DG DOC DX ECG EPS ES FID GM HC HD IO IOL IVOCT IVUS KER LS M3D MG MR NM OAM
+        OCT OP OPM OPT OPV OT OSS PR PT PX REG RESP RF RG RTBrachy RTDOSE RTIMAGE RTIonBeamsTreatmentRecord
+        RTIonPlan RTPLAN RTRECORD RTRAD RTSEGANN RTSTRUCT RTV SC SEG SM SMR SR SRF ST TG US VA XA XC XCD
+    '''.split())
 
 
 class ManufacturerValidator(RegexValidator):
@@ -191,107 +199,88 @@ class HighBitValidator(RegexValidator):
     regex = re.compile(r'^[1-9]\d{0,1}$')
 
 
-class PixelRepresentationValidator(RegexValidator):
+class PixelRepresentationValidator(ControlledVocabularyValidator):
     '''A validator that checks the PixelRepresentation tag.'''
 
     description = 'PixelRepresentation must be 0 or 1'
     tag = pydicom.tag.Tag((0x0028, 0x0103))
-    regex = re.compile(r'^(0|1)$')
+    allowed_values = frozenset(('0', '1'))
 
 
-class PhotometricInterpretationValidator(CaseInsensitiveAndWarningRegexValidator):
+class PhotometricInterpretationValidator(ControlledVocabularyValidator, CaseInsensitiveAndWarningRegexValidator):
     '''A validator that checks the PhotometricInterpretation tag.'''
 
     description = 'PhotometricInterpretation must be a valid DICOM code (MONOCHROME1, MONOCHROME2, PALETTE_COLOR, RGB, YBR_FULL, YBR_PARTIAL_422, etc.)'
     tag = pydicom.tag.Tag((0x0028, 0x0004))
-    # 🔮 Might be nicer to have a "controlled vocabulary" base class so that validators like this
-    # one can just simply list their allowed values rather than come up with a regex.
-    regex = re.compile(r'^(MONOCHROME1|MONOCHROME2|PALETTE_COLOR|RGB|YBR_FULL)$')
+    allowed_values = frozenset(('MONOCHROME1', 'MONOCHROME2', 'PALETTE_COLOR', 'RGB', 'YBR_FULL'))
 
 
-class WindowCenterValidator(Validator):
-    '''A validator that checks the WindowCenter tag.'''
+class MonochromeGatedValidator(Validator):
+    '''An abstract validator for numeric tags that are only required for MONOCHROME1 or MONOCHROME2 images.
 
-    description = 'WindowCenter must be an integer or floating point number; multiple numbers separated by backslashes are allowed'
-    tag = pydicom.tag.Tag((0x0028, 0x1050))
+    WindowCenter and WindowWidth both depend on the same PhotometricInterpretation check, so they share
+    it and the rest of validation here.
+    '''
+
+    _invalid_description: ClassVar[str]  # Subclasses must override with a concrete value
+    _missing_description: ClassVar[str]  # Subclasses must override with a concrete value
+
+    def _is_monochrome(self, ds: pydicom.Dataset) -> bool:
+        '''Tell if the PhotometricInterpretation of `ds` is MONOCHROME1 or MONOCHROME2.'''
+        photometric_interpretation = ds.get_item(_photometric_interpretation_tag)
+        return photometric_interpretation is not None and any(
+            v.strip() in ('MONOCHROME1', 'MONOCHROME2') for v in textify_dicom_value(photometric_interpretation.value)
+        )
 
     def validate(self, potential_file: PotentialFile) -> list[ValidationFinding]:
         '''Validate the given DICOM dataset and return a list of findings.'''
-        ds = potential_file.dcmread(stop_before_pixels=True, force=False)
+        ds = self.dcmread(potential_file)
         findings: list[ValidationFinding] = []
 
-        # Validate the WindowCenter tag only if the PhotometricInterpretation is MONOCHROME1 or MONOCHROME2
-        photometric_interpretation = ds.get_item((0x0028, 0x0004))
-        if photometric_interpretation is not None:
-            value = textify_dicom_value(photometric_interpretation.value)
-            if any(v.strip() in ('MONOCHROME1', 'MONOCHROME2') for v in value):
-                elem = ds.get_item(self.tag)
-                if elem is not None:
-                    values = convert_raw_data_element(elem).value
-                    # Normalize values to always be iterable (handle both MultiValue and single values like DSfloat)
-                    if values is None:
-                        values_iter = []
-                    elif isinstance(values, str) or not isinstance(values, Sequence):
-                        values_iter = [values]
-                    else:
-                        values_iter = values
-                    try:
-                        [float(v) for v in values_iter]
-                    except (ValueError, TypeError):
-                        findings.append(ValidationFinding(
-                            file=potential_file, value=values, tag=self.tag,
-                            description=f'WindowCenter must be an integer or floating point number'
-                        ))
+        # Validate the tag only if the PhotometricInterpretation is MONOCHROME1 or MONOCHROME2
+        if self._is_monochrome(ds):
+            elem = ds.get_item(self.tag)
+            if elem is not None:
+                if isinstance(elem, RawDataElement): elem = convert_raw_data_element(elem)
+                values = elem.value
+                # Normalize values to always be iterable (handle both MultiValue and single values like DSfloat)
+                if values is None:
+                    values_iter = []
+                elif isinstance(values, str) or not isinstance(values, Sequence):
+                    values_iter = [values]
                 else:
+                    values_iter = values
+                try:
+                    [float(v) for v in values_iter]
+                except (ValueError, TypeError):
                     findings.append(ValidationFinding(
-                        file=potential_file, value='value missing', tag=self.tag,
-                        description=f'WindowCenter tag is missing but required for MONOCHROME1 or MONOCHROME2 PhotometricInterpretation'
+                        file=potential_file, value=values, tag=self.tag, description=self._invalid_description
                     ))
+            else:
+                findings.append(ValidationFinding(
+                    file=potential_file, value='value missing', tag=self.tag, description=self._missing_description
+                ))
         return findings
 
 
-class WindowWidthValidator(RegexValidator):
-    '''A validator that checks the WindowWidth tag.'''
+class WindowCenterValidator(MonochromeGatedValidator):
+    '''A validator that checks the WindowCenter tag.'''
 
-    # 🔮 TODO: refactor this with the WindowCenterValidator class
+    description = 'WindowCenter must be an integer or floating point number; multiple numbers separated by backslashes are allowed'
+    tag = pydicom.tag.Tag((0x0028, 0x1050))
+    required_tags = (_photometric_interpretation_tag,)
+    _invalid_description = 'WindowCenter must be an integer or floating point number'
+    _missing_description = 'WindowCenter tag is missing but required for MONOCHROME1 or MONOCHROME2 PhotometricInterpretation'
 
-    description = 'WindowWidth must be an integer or floating point number; multiple numbers separated by backslashes are allowed'
-    tag = pydicom.tag.Tag((0x0028, 0x1051))
-    regex = re.compile(r'^-?(\d+\.\d*|\d*\.\d+|\d+)(\\-?(\d+\.\d*|\d*\.\d+|\d+))*$')
 
-    def validate(self, potential_file: PotentialFile) -> list[ValidationFinding]:
-        '''Validate the given DICOM dataset and return a list of findings.'''
-        ds = potential_file.dcmread(stop_before_pixels=True, force=False)
-        findings: list[ValidationFinding] = []
+class WindowWidthValidator(MonochromeGatedValidator):
+    '''A validator that checks the WindowWidth tag.'''
 
-        # Validate the WindowCenter tag only if the PhotometricInterpretation is MONOCHROME1 or MONOCHROME2
-        photometric_interpretation = ds.get_item((0x0028, 0x0004))
-        if photometric_interpretation is not None:
-            value = textify_dicom_value(photometric_interpretation.value)
-            if any(v.strip() in ('MONOCHROME1', 'MONOCHROME2') for v in value):
-                elem = ds.get_item(self.tag)
-                if elem is not None:
-                    values = convert_raw_data_element(elem).value
-                    # Normalize values to always be iterable (handle both MultiValue and single values like DSfloat)
-                    if values is None:
-                        values_iter = []
-                    elif isinstance(values, str) or not isinstance(values, Sequence):
-                        values_iter = [values]
-                    else:
-                        values_iter = values
-                    try:
-                        [float(v) for v in values_iter]
-                    except (ValueError, TypeError):
-                        findings.append(ValidationFinding(
-                            file=potential_file, value=values, tag=self.tag,
-                            description=f'WindowCenter must be an integer or floating point number'
-                        ))
-                else:
-                    findings.append(ValidationFinding(
-                        file=potential_file, value='value missing', tag=self.tag,
-                        description=f'WindowWidth tag is missing but required for MONOCHROME1 or MONOCHROME2 PhotometricInterpretation'
-                    ))
-        return findings
+    description = 'WindowWidth must be an integer or floating point number; multiple numbers separated by backslashes are allowed'
+    tag = pydicom.tag.Tag((0x0028, 0x1051))
+    required_tags = (_photometric_interpretation_tag,)
+    _invalid_description = 'WindowCenter must be an integer or floating point number'
+    _missing_description = 'WindowWidth tag is missing but required for MONOCHROME1 or MONOCHROME2 PhotometricInterpretation'
 
 
 class PixelSpacingValidator(RegexValidator):
@@ -319,10 +308,10 @@ class ImageOrientationPatientValidator(Validator):
     def validate(self, potential_file: PotentialFile) -> list[ValidationFinding]:
         '''Validate the given DICOM dataset and return a list of findings.'''
         findings: list[ValidationFinding] = []
-        ds = potential_file.dcmread(stop_before_pixels=True, force=False)
+        ds = self.dcmread(potential_file)
         elem = ds.get_item(self.tag)
         if elem is not None:
-            elem = convert_raw_data_element(elem)
+            if isinstance(elem, RawDataElement): elem = convert_raw_data_element(elem)
             if elem.value is None:
                 finding = ValidationFinding(
                     file=potential_file, value='ImageOrientationPatient tag value has null values', tag=self.tag,
@@ -363,7 +352,7 @@ class ImageTypeValidator(Validator):
     def validate(self, potential_file: PotentialFile) -> list[ValidationFinding]:
         '''Validate the given DICOM dataset and return a list of findings.'''
         findings: list[ValidationFinding] = []
-        ds = potential_file.dcmread(stop_before_pixels=True, force=False)
+        ds = self.dcmread(potential_file)
         elem = ds.get_item(self.tag)
         if elem is not None:
             if elem.value is None:
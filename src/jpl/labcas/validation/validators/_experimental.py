@@ -18,7 +18,7 @@ class ExperimentalModalityValidator(Validator):
     def validate(self, potential_file: PotentialFile) -> list[ValidationFinding]:
         return [ValidationFinding(
             file=potential_file,
-            value=potential_file.dcmread(stop_before_pixels=True, force=False).Modality,
+            value=self.dcmread(potential_file).Modality,
             tag=self.tag, description='Modality is always UNACCEPTABLE for testing'
         )]
 
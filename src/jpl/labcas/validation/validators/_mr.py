@@ -3,11 +3,74 @@
 '''🛂 EDRN DICOM Validation: MR validators.'''
 
 from ._base import RegexValidator, DICOMUIDValidator
-from .._classes import ValidationFinding, PotentialFile
-from .._functions import modality
-import pydicom, re, os, logging
+from .._classes import Validator, ValidationFinding, PotentialFile
+from .._functions import modality, has_dicom_magic
+from ..const import IGNORED_FILES
+from concurrent.futures import ThreadPoolExecutor
+from pydicom.dataelem import convert_raw_data_element, RawDataElement
+from pydicom.multival import MultiValue
+import pydicom, re, os, logging, functools
 
 _logger = logging.getLogger(__name__)
+_modality_tag = pydicom.tag.Tag((0x0008, 0x0060))
+_series_instance_uid_tag = pydicom.tag.Tag((0x0020, 0x000E))
+_acquisition_matrix_tag = pydicom.tag.Tag((0x0018, 0x1310))
+_sibling_reads = 8  # How many sibling headers may be read at once, shared among all the scanning processes
+_sibling_read_threads = _sibling_reads  # How many sibling headers _series_map reads at once in this process
+
+
+def share_sibling_reads(processes: int):
+    '''Split the sibling header reads among `processes` scanning at once, so they don't swamp shared storage.'''
+    global _sibling_read_threads
+    _sibling_read_threads = max(1, _sibling_reads // max(1, processes))
+
+
+def _series_instance_uid(ds: pydicom.Dataset) -> str | None:
+    '''Get the SeriesInstanceUID of `ds` by its tag, sparing the keyword lookup, or None if it has none.'''
+    elem = ds.get(_series_instance_uid_tag)
+    return elem.value if elem is not None else None
+
+
+def _sibling_series(entry: os.DirEntry) -> tuple[str, tuple[int, int]] | None:
+    '''Get the SeriesInstanceUID and (device, inode) of the DICOM file at `entry`, or None if it has none.'''
+    # Files validation ignores can't be slices in a series either, and the name alone tells us so
+    if entry.name in IGNORED_FILES: return None
+    try:
+        if not entry.is_file(): return None
+        stat = entry.stat()
+        # Most non-DICOM files fail the magic check, so they never get as far as pydicom raising over them
+        if not has_dicom_magic(entry.path): return None
+        # Try to read as DICOM and check SeriesInstanceUID, reading nothing else for efficiency
+        ds = pydicom.dcmread(entry.path, stop_before_pixels=True, force=False, specific_tags=[_series_instance_uid_tag])
+    except Exception:
+        # Not a valid DICOM file or can't read it, skip; a malformed header can make pydicom raise nearly anything
+        return None
+    series_uid = _series_instance_uid(ds)
+    return (series_uid, (stat.st_dev, stat.st_ino)) if series_uid else None
+
+
+@functools.lru_cache(maxsize=1024)
+def _series_map(directory: str) -> dict[str, frozenset[tuple[int, int]]]:
+    '''Map each SeriesInstanceUID in the DICOM files directly in `directory` to the files that have it.
+
+    Files are identified by (device, inode) so links to the same file count once. Every file in a directory
+    asks about its siblings, so this reads each sibling's header once for all of them rather than once per
+    asking file. Those reads mostly wait on storage, so several happen at once on threads, as many as
+    `share_sibling_reads` leaves this process.
+    '''
+    with os.scandir(directory) as entries:
+        entries = list(entries)
+    files_by_series: dict[str, set[tuple[int, int]]] = {}
+    if _sibling_read_threads == 1:
+        siblings = map(_sibling_series, entries)  # No point starting a thread to read one at a time
+    else:
+        with ThreadPoolExecutor(max_workers=_sibling_read_threads) as executor:
+            siblings = list(executor.map(_sibling_series, entries))
+    for sibling in siblings:
+        if sibling is None: continue
+        series_uid, file_id = sibling
+        files_by_series.setdefault(series_uid, set()).add(file_id)
+    return {series_uid: frozenset(files) for series_uid, files in files_by_series.items()}
 
 
 class SpacingBetweenSlicesValidator(RegexValidator):
@@ -15,9 +78,13 @@ class SpacingBetweenSlicesValidator(RegexValidator):
 
     description = 'SpacingBetweenSlices must be a positive number, floating point or integer, and is optional'
     tag = pydicom.tag.Tag((0x0018, 0x0088))
-    regex = re.compile(r'^([1-9]\d*(\.\d+)?|0\.\d+)?$')
-    series_instance_uids: set[str] = set()
+    required_tags = (_modality_tag, _series_instance_uid_tag)
+    regex = re.compile(r'^(?:[1-9]\d*(?:\.\d+)?|0\.\d+)?$')  # Only match or no match matters, so capture nothing
 
+    def __init__(self):
+        '''Initialize the validator.'''
+        super().__init__()
+        self._seen_multi_slice_uids: set[str] = set()  # Series we've already found more than one slice of
 
     def _has_multiple_slices_in_series(self, ds: pydicom.Dataset) -> bool:
         '''Check if there are multiple slices in the same series.
@@ -33,34 +100,21 @@ class SpacingBetweenSlicesValidator(RegexValidator):
         if not os.path.isdir(directory): return False
         
         try:
-            current_series_uid = getattr(ds, 'SeriesInstanceUID', None)
-            if current_series_uid in self.series_instance_uids: return True
+            current_series_uid = _series_instance_uid(ds)
+            if current_series_uid in self._seen_multi_slice_uids: return True
             if not current_series_uid: return False
             
             # Check for other DICOM files in the same directory with the same SeriesInstanceUID
-            for filename in os.listdir(directory):
-                filepath = os.path.join(directory, filename)
-                if not os.path.isfile(filepath): continue
-                
-                # Skip the current file
-                if os.path.samefile(filepath, ds.filename): continue
-                
-                try:
-                    # Try to read as DICOM and check SeriesInstanceUID (stop_before_pixels=True for efficiency)
-                    other_ds = pydicom.dcmread(filepath, stop_before_pixels=True, force=False)
-                    other_series_uid = getattr(other_ds, 'SeriesInstanceUID', None)
-                    if current_series_uid == other_series_uid:
-                        # Found at least one other slice in the same series
-                        _logger.debug(
-                            '✅ Found at least one other slice in the same series %s in %s',
-                            current_series_uid, ds.filename
-                        )
-                        self.series_instance_uids.add(current_series_uid)
-                        return True
-                except (pydicom.errors.InvalidDicomError, IOError, Exception):
-                    # Not a valid DICOM file or can't read it, skip
-                    continue
-            
+            stat = os.stat(ds.filename)
+            if _series_map(directory).get(current_series_uid, frozenset()) - {(stat.st_dev, stat.st_ino)}:
+                # Found at least one other slice in the same series
+                _logger.debug(
+                    '✅ Found at least one other slice in the same series %s in %s',
+                    current_series_uid, ds.filename
+                )
+                self._seen_multi_slice_uids.add(current_series_uid)
+                return True
+
             return False
         except Exception:
             # If anything goes wrong, assume false
@@ -69,13 +123,13 @@ class SpacingBetweenSlicesValidator(RegexValidator):
     def validate(self, potential_file: PotentialFile) -> list[ValidationFinding]:
         '''Validate the given DICOM dataset and return a list of findings.'''
         findings: list[ValidationFinding] = []
-        ds = potential_file.dcmread(stop_before_pixels=True, force=False)
+        ds = self.dcmread(potential_file)
         if modality(ds) != 'MR': return findings
 
         # Only validate SpacingBetweenSlices when there are multiple slices in the series
         if self._has_multiple_slices_in_series(ds):
             other_findings = super().validate(potential_file)
-            current_series_uid = getattr(ds, 'SeriesInstanceUID', None)
+            current_series_uid = _series_instance_uid(ds)
 
             # @hoodriverheather wants the description to be more precise and not just "missing tag"
             for finding in other_findings:
@@ -88,20 +142,37 @@ class SpacingBetweenSlicesValidator(RegexValidator):
         return findings
 
 
-class AcquisitionMatrixValidator(RegexValidator):
+class AcquisitionMatrixValidator(Validator):
     '''A validator that checks the AcquisitionMatrix tag.'''
 
     description = 'AcquisitionMatrix must be four non-negative integers'
-    tag = pydicom.tag.Tag((0x0018, 0x0080))
-    regex = re.compile(r'^\[(\d+,\s*){3}\d+\]$')
+    tag = _acquisition_matrix_tag
+    required_tags = (_modality_tag,)
 
     def validate(self, potential_file: PotentialFile) -> list[ValidationFinding]:
         '''Validate the given DICOM dataset and return a list of findings.'''
         findings: list[ValidationFinding] = []
+        ds = self.dcmread(potential_file)
         if modality(ds) != 'MR': return findings
 
-        # Only bother to validate AcquisitionMatrix if tag (0018, 1310) exists and has a value
-        elem = ds.get_item((0x0018, 0x1310))
-        if elem is not None and elem.value:
-            findings.extend(super().validate(potential_file))
+        # Only bother to validate AcquisitionMatrix if it exists and has a value; that's empty bytes when it's
+        # still raw, and a decoded value such as a single 0 is there to be checked
+        elem = ds.get_item(self.tag)
+        if elem is None: return findings
+        if isinstance(elem, RawDataElement):
+            if not elem.value: return findings
+            elem = convert_raw_data_element(elem)
+        elif elem.is_empty:
+            return findings
+
+        # It's US with a multiplicity of 4, so check the integers pydicom decodes instead of a rendering of them
+        values = elem.value
+        if not (
+            isinstance(values, (list, MultiValue)) and len(values) == 4
+            and all(isinstance(v, int) and v >= 0 for v in values)
+        ):
+            findings.append(ValidationFinding(
+                file=potential_file, value=str(values), tag=self.tag,
+                description=f'Value for tag does not match expected pattern: {self.description}'
+            ))
         return findings
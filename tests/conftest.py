@@ -0,0 +1,26 @@
+# encoding: utf-8
+
+'''🛂 EDRN DICOM Validation: shared test fixtures.'''
+
+from pydicom.data import get_testdata_file
+import pytest, pydicom, os
+
+
+@pytest.fixture
+def write_dicom():
+    '''Give a function that writes a copy of one of pydicom's test files to a path, with some elements changed.
+
+    Call it with the path, optionally the test file's name (MR_small.dcm by default), and keywords for the
+    elements to set; a keyword given None is deleted instead. It makes any missing folders and gives back the path.
+    '''
+    def _write(path, source: str = 'MR_small.dcm', **elements) -> str:
+        ds = pydicom.dcmread(get_testdata_file(source))
+        for keyword, value in elements.items():
+            if value is None:
+                if keyword in ds: delattr(ds, keyword)
+            else:
+                setattr(ds, keyword, value)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        ds.save_as(path)
+        return str(path)
+    return _write
@@ -0,0 +1,26 @@
+# encoding: utf-8
+
+'''🛂 EDRN DICOM Validation: tests for findings.'''
+
+from jpl.labcas.validation._classes import PotentialFile, ErrorFinding, HeaderFinding, ImageFinding, ValidationFinding
+from pydicom.tag import Tag
+
+
+def test_findings_sort_with_missing_fields_and_mixed_kinds():
+    '''Findings sort even when some lack a tag or description and they aren't all the same kind.'''
+    potential_file = PotentialFile('/c/Images_Site_aaa/1234567/a.dcm')
+    findings = [
+        HeaderFinding(file=potential_file, value='v'),
+        HeaderFinding(file=potential_file, value='v', tag=Tag(0x00100010), description='Name'),
+        HeaderFinding(file=potential_file, value='v', tag=Tag(0x00100010)),
+        ValidationFinding(file=potential_file, value='', tag=Tag(0x00080060)),
+        ImageFinding(file=potential_file, value='v', pattern='phone', index=0),
+        ErrorFinding(file=potential_file, value='oops'),
+    ]
+    ordered = sorted(findings)
+    assert [type(finding).__name__ for finding in ordered] == [
+        'ErrorFinding', 'HeaderFinding', 'HeaderFinding', 'HeaderFinding', 'ImageFinding', 'ValidationFinding'
+    ]
+    assert [(finding.tag, finding.description) for finding in ordered[1:4]] == [
+        (Tag(0x00100010), 'Name'), (Tag(0x00100010), None), (None, None)
+    ]
@@ -0,0 +1,149 @@
+# encoding: utf-8
+
+'''🛂 EDRN DICOM Validation: tests for reading findings databases.'''
+
+from jpl.labcas.validation._classes import (
+    PotentialFile, Report, ErrorFinding, HeaderFinding, ImageFinding, ValidationFinding, _kinds_by_finding_type
+)
+from jpl.labcas.validation.main import _create_findings_db, _finding_row, _insert_finding_sql, _load_findings_from_db
+from pydicom.tag import Tag
+import csv, sqlite3
+
+
+# The findings table as earlier versions made it, with finding types as names and tags as "group,element" text
+_old_schema = '''
+    CREATE TABLE findings (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        file_path TEXT NOT NULL,
+        site_id TEXT NOT NULL,
+        event_id TEXT NOT NULL,
+        file_name TEXT NOT NULL,
+        finding_type TEXT NOT NULL,
+        value TEXT NOT NULL,
+        score REAL NOT NULL,
+        tag TEXT,
+        description TEXT,
+        pattern TEXT,
+        index_val INTEGER
+    )
+'''
+_old_rows = (
+    ('/c/Images_Site_aaa/1234567/a.dcm', 'Images_Site_aaa', '1234567', 'a.dcm', 'HeaderFinding', 'DOE^JANE', 0.9, '16,16', 'Name', None, None),
+    ('/c/Images_Site_aaa/1234567/a.dcm', 'Images_Site_aaa', '1234567', 'a.dcm', 'ValidationFinding', '', 1.0, '8,96', 'Missing', None, None),
+    ('/c/Images_Site_aaa/1234567/a.dcm', 'Images_Site_aaa', '1234567', 'a.dcm', 'HeaderFinding', 'x', 0.9, 'garbage', None, None, None),
+)
+
+
+def _make_old_db(path) -> str:
+    '''Write a findings database at `path` the way earlier versions did and return its path.'''
+    conn = sqlite3.connect(path)
+    conn.execute(_old_schema)
+    conn.executemany('''
+        INSERT INTO findings (file_path, site_id, event_id, file_name, finding_type, value, score, tag, description, pattern, index_val)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', _old_rows)
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+def test_report_on_old_database(tmp_path):
+    '''A report from an older database gives the tags their names, as it did when it was written.'''
+    db_path = _make_old_db(tmp_path / 'old.db')
+    Report(db_path=db_path, score=0.5).generate_report(str(tmp_path))
+    with open(tmp_path / 'Images_Site_aaa-1234567.csv', newline='') as io:
+        details = [row[5] for row in csv.reader(io)][1:]
+    assert any(detail.startswith('(0010,0010) (PatientName)') for detail in details)
+    assert any(detail.startswith('(0008,0060) (Modality)') for detail in details)
+    assert any(detail.startswith('unknown tag') for detail in details)
+
+
+def test_load_old_database(tmp_path):
+    '''Findings loaded from an older database get their types and tags back.'''
+    findings = _load_findings_from_db(_make_old_db(tmp_path / 'old.db'))
+    assert [type(finding) for finding in findings] == [HeaderFinding, ValidationFinding, HeaderFinding]
+    assert [finding.tag for finding in findings] == [Tag(0x00100010), Tag(0x00080060), None]
+
+
+def test_round_trip_through_current_database(tmp_path):
+    '''Findings written the way workers write them come back the same, with their types and tags as numbers.'''
+    potential_file = PotentialFile.get('/c/Images_Site_aaa/1234567/a.dcm')
+    findings = [
+        HeaderFinding(file=potential_file, value='DOE^JANE', score=0.9, tag=Tag(0x00100010), description='Name'),
+        ValidationFinding(file=potential_file, value='', tag=Tag(0x00080060), description='Missing'),
+        ImageFinding(file=potential_file, value='555-1212', score=0.8, pattern='phone', index=2),
+    ]
+    db_path = str(tmp_path / 'new.db')
+    _create_findings_db(db_path)
+    conn = sqlite3.connect(db_path)
+    conn.executemany(_insert_finding_sql, [_finding_row(finding) for finding in findings])
+    conn.commit()
+    assert conn.execute('SELECT typeof(finding_type), typeof(tag) FROM findings LIMIT 1').fetchone() == ('integer', 'integer')
+    conn.close()
+    assert _load_findings_from_db(db_path) == findings
+
+
+def _write_db(path, findings) -> str:
+    '''Write `findings` to a new findings database at `path` the way workers do and give back its path.'''
+    db_path = str(path)
+    _create_findings_db(db_path)
+    conn = sqlite3.connect(db_path)
+    conn.executemany(_insert_finding_sql, [_finding_row(finding) for finding in findings])
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+def test_report_row_order(tmp_path):
+    '''A report has a CSV per site and event, with files in path order, then findings by type and falling score.'''
+    def _file(site, event, name):
+        return PotentialFile.get(f'/c/Images_Site_{site}/{event}/{name}')
+
+    a1, a2, b1 = _file('aaa', '1111111', 'b.dcm'), _file('aaa', '1111111', 'a.dcm'), _file('aaa', '2222222', 'a.dcm')
+    c1, c2 = _file('ccc', '1111111', 'z.dcm'), _file('ccc', '1111111', 'y.dcm')
+    name, modality = Tag(0x00100010), Tag(0x00080060)
+    findings = [  # In no particular order
+        ValidationFinding(file=c1, value='c1-missing', tag=modality),
+        HeaderFinding(file=a1, value='a1-low', score=0.6, tag=name),
+        ImageFinding(file=a1, value='a1-image', score=0.8, pattern='phone', index=0),
+        HeaderFinding(file=a1, value='a1-high', score=0.95, tag=name),
+        ErrorFinding(file=a1, value='a1-error', error_message='oops'),
+        HeaderFinding(file=a1, value='a1-tie-first', score=0.7, tag=name),
+        HeaderFinding(file=a1, value='a1-tie-second', score=0.7, tag=name),
+        HeaderFinding(file=a1, value='a1-below', score=0.1, tag=name),
+        ValidationFinding(file=a2, value='a2-missing', tag=modality),
+        HeaderFinding(file=a2, value='a2-header', score=0.9, tag=name),
+        ImageFinding(file=b1, value='b1-image', score=0.8, pattern='email', index=1),
+        HeaderFinding(file=c2, value='c2-header', score=0.5, tag=name),
+        HeaderFinding(file=c1, value='c1-header', score=0.99, tag=name),
+    ]
+    Report(db_path=_write_db(tmp_path / 'findings.db', findings), score=0.5).generate_report(str(tmp_path))
+    expected = {
+        'Images_Site_aaa-1111111.csv': [
+            ('a.dcm', '0.9', HeaderFinding, 'a2-header'),
+            ('a.dcm', '1.0', ValidationFinding, 'a2-missing'),
+            ('b.dcm', '1.0', ErrorFinding, 'a1-error'),
+            ('b.dcm', '0.95', HeaderFinding, 'a1-high'),
+            ('b.dcm', '0.7', HeaderFinding, 'a1-tie-first'),
+            ('b.dcm', '0.7', HeaderFinding, 'a1-tie-second'),
+            ('b.dcm', '0.6', HeaderFinding, 'a1-low'),
+            ('b.dcm', '0.8', ImageFinding, 'a1-image'),
+        ],
+        'Images_Site_aaa-2222222.csv': [
+            ('a.dcm', '0.8', ImageFinding, 'b1-image'),
+        ],
+        'Images_Site_ccc-1111111.csv': [
+            ('y.dcm', '0.5', HeaderFinding, 'c2-header'),
+            ('z.dcm', '0.99', HeaderFinding, 'c1-header'),
+            ('z.dcm', '1.0', ValidationFinding, 'c1-missing'),
+        ],
+    }
+    assert sorted(path.name for path in tmp_path.glob('*.csv')) == sorted(expected)
+    for csv_name, rows in expected.items():
+        with open(tmp_path / csv_name, newline='') as io:
+            report_rows = list(csv.reader(io))[1:]
+        site_id, event_id = csv_name[:-4].rsplit('-', 1)
+        assert [(row[0], row[1], row[2], row[3], row[4]) for row in report_rows] == [
+            (site_id, event_id, file_name, score, _kinds_by_finding_type[kind.__name__]) for file_name, score, kind, _ in rows
+        ]
+        assert all(value in row[5] for row, (_, _, _, value) in zip(report_rows, rows))
@@ -0,0 +1,62 @@
+# encoding: utf-8
+
+'''🛂 EDRN DICOM Validation: tests for each worker's findings database writer.'''
+
+from jpl.labcas.validation import main
+import pytest, queue, threading
+
+
+_patience = 10.0  # How many seconds something that mustn't hang gets before we say it did
+
+
+def _finishes(target, *args) -> bool:
+    '''Tell if calling `target` with `args` on a thread finishes in time.'''
+    thread = threading.Thread(target=target, args=args, daemon=True)
+    thread.start()
+    thread.join(_patience)
+    return not thread.is_alive()
+
+
+def _dead_writer() -> threading.Thread:
+    '''Make a writer thread that has already died without taking anything off its queue.'''
+    writer = threading.Thread(target=lambda: None)
+    writer.start()
+    writer.join()
+    return writer
+
+
+def test_full_queue_with_dead_writer_raises(monkeypatch):
+    '''Putting rows on a full queue whose writer is gone raises rather than blocking for good.'''
+    monkeypatch.setattr(main, '_db_put_timeout', 0.05)
+    rows_queue, writer = queue.Queue(maxsize=1), _dead_writer()
+    rows_queue.put([])
+    with pytest.raises(RuntimeError):
+        main._put_for_writer(rows_queue, writer, [])
+
+
+def test_stopping_dead_writer_with_full_queue_returns(monkeypatch):
+    '''The exit hook that stops the writer returns even when the writer died with its queue full.'''
+    monkeypatch.setattr(main, '_db_put_timeout', 0.05)
+    rows_queue, writer = queue.Queue(maxsize=1), _dead_writer()
+    rows_queue.put([])
+    assert _finishes(main._stop_writer, rows_queue, writer)
+
+
+def test_writer_that_cannot_connect_keeps_draining(tmp_path):
+    '''A writer that can't open its database still takes rows until stopped, so the worker never blocks.'''
+    rows_queue = queue.Queue(maxsize=2)
+    writer = threading.Thread(
+        target=main._write_findings_in_background, args=(str(tmp_path / 'missing' / 'findings.db'), rows_queue),
+        daemon=True
+    )
+    writer.start()
+
+    done = threading.Event()
+
+    def _scan_lots():
+        for _ in range(20): main._put_for_writer(rows_queue, writer, [('row',)])
+        main._stop_writer(rows_queue, writer)
+        done.set()
+
+    assert _finishes(_scan_lots) and done.is_set()
+    assert not writer.is_alive()
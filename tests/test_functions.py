@@ -0,0 +1,65 @@
+# encoding: utf-8
+
+'''🛂 EDRN DICOM Validation: tests for functions.'''
+
+from jpl.labcas.validation import _functions
+from jpl.labcas.validation._functions import iterate_paths
+import os
+
+
+def _touch(path) -> str:
+    '''Make an empty file at `path`, and any folders it needs, and give back its path.'''
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, 'w').close()
+    return str(path)
+
+
+def _make_tree(root) -> set[str]:
+    '''Make a collection of files under `root` and give the paths iterate_paths should yield from it.'''
+    wanted = {
+        _touch(root / 'Prostate_MRI.cfg'),
+        _touch(root / 'Images_Site_aaa' / '1234567' / 'img0'),
+        _touch(root / 'Images_Site_aaa' / '1234567' / 'img1.dcm'),
+        _touch(root / 'Images_Site_aaa' / '1234567' / 'series' / 'img2'),
+        _touch(root / 'Images_Site_bbb' / '7654321' / 'img3'),
+    }
+    for ignored in ('.DS_Store', 'DICOMDIR', 'Thumbs.db'):
+        _touch(root / 'Images_Site_aaa' / '1234567' / ignored)
+    _touch(root / 'Images_Site_aaa' / '1234567' / 'thumbnails' / 'x.png')
+    _touch(root / 'Images_Site_aaa' / '1234567' / 'thumbnails' / 'sub' / 'y.png')
+    _touch(root / 'thumbnails' / 'sub' / 'deeper' / 'z.png')
+    return wanted
+
+
+def test_iterate_paths_skips_thumbnails_and_ignored_files(tmp_path):
+    '''Whole thumbnails subtrees and ignored files never come out of iterate_paths.'''
+    wanted = _make_tree(tmp_path)
+    paths = list(iterate_paths(str(tmp_path)))
+    assert len(paths) == len(wanted)
+    assert set(paths) == wanted
+
+
+def test_iterate_paths_skips_unreadable_directories(tmp_path, monkeypatch):
+    '''A directory that can't be listed is passed over and the rest of the tree still comes out.'''
+    wanted = _make_tree(tmp_path)
+    unreadable = str(tmp_path / 'Images_Site_aaa')
+    scandir = os.scandir
+
+    def _scandir(path):
+        if str(path) == unreadable: raise PermissionError(13, 'Permission denied', path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', _scandir)
+    assert set(iterate_paths(str(tmp_path))) == {path for path in wanted if not path.startswith(unreadable + os.sep)}
+
+
+def test_iterate_paths_order_is_repeatable(tmp_path, monkeypatch):
+    '''The paths come out in the same order on every run, however many directories are listed at once.'''
+    for site in range(5):
+        for event in range(5):
+            for image in range(3):
+                _touch(tmp_path / f'Images_Site_{site}' / f'{event:07d}' / f'img{image}')
+    first = list(iterate_paths(str(tmp_path)))
+    assert all(list(iterate_paths(str(tmp_path))) == first for _ in range(5))
+    monkeypatch.setattr(_functions, '_walk_threads', 1)
+    assert list(iterate_paths(str(tmp_path))) == first
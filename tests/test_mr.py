@@ -0,0 +1,165 @@
+# encoding: utf-8
+
+'''🛂 EDRN DICOM Validation: tests for the MR validators.'''
+
+from jpl.labcas.validation._classes import PotentialFile
+from jpl.labcas.validation.validators import SpacingBetweenSlicesValidator, _mr
+from jpl.labcas.validation.validators._mr import AcquisitionMatrixValidator, _series_map, share_sibling_reads
+import pydicom, pytest, os
+
+
+_series = '1.2.3.4.5.1'        # A series to put slices in
+_other_series = '1.2.3.4.5.2'  # And another
+
+
+@pytest.fixture(autouse=True)
+def _fresh_series_maps(monkeypatch):
+    '''Forget any directory's series map and sharing of sibling reads from earlier tests.'''
+    monkeypatch.setattr(_mr, '_sibling_read_threads', _mr._sibling_reads)
+    _series_map.cache_clear()
+    yield
+    _series_map.cache_clear()
+
+
+def _file_id(path) -> tuple[int, int]:
+    '''Give the (device, inode) of the file at `path`.'''
+    stat = os.stat(path)
+    return stat.st_dev, stat.st_ino
+
+
+def test_series_map(tmp_path, write_dicom):
+    '''Each series maps to its slices; links count once, and ignored and non-DICOM files not at all.'''
+    first = write_dicom(tmp_path / 'img0', SeriesInstanceUID=_series)
+    second = write_dicom(tmp_path / 'img1', SeriesInstanceUID=_series)
+    os.link(first, tmp_path / 'link-to-img0')
+    write_dicom(tmp_path / 'DICOMDIR', SeriesInstanceUID=_series)
+    (tmp_path / 'notes.txt').write_text('not DICOM')
+    other = write_dicom(tmp_path / 'img2', SeriesInstanceUID=_other_series)
+    write_dicom(tmp_path / 'sub' / 'img3', SeriesInstanceUID=_series)  # Not directly in the directory
+    assert _series_map(str(tmp_path)) == {
+        _series: frozenset({_file_id(first), _file_id(second)}),
+        _other_series: frozenset({_file_id(other)}),
+    }
+
+
+def test_series_map_same_with_one_read_at_a_time(tmp_path, write_dicom):
+    '''Reading siblings without threads maps them the same as reading several at once.'''
+    for idx in range(12):
+        write_dicom(tmp_path / f'img{idx}', SeriesInstanceUID=_series if idx % 3 else _other_series)
+    threaded = _series_map(str(tmp_path))
+    _series_map.cache_clear()
+    share_sibling_reads(_mr._sibling_reads)
+    assert _series_map(str(tmp_path)) == threaded
+
+
+@pytest.mark.parametrize('processes, threads', [(1, 8), (2, 4), (3, 2), (8, 1), (64, 1), (0, 8)])
+def test_sibling_reads_are_shared_among_processes(processes, threads):
+    '''Scanning with more processes leaves each fewer sibling reads at once, but always at least one.'''
+    share_sibling_reads(processes)
+    assert _mr._sibling_read_threads == threads
+
+
+def test_one_read_at_a_time_starts_no_threads(tmp_path, write_dicom, monkeypatch):
+    '''A process left one sibling read at a time doesn't start a thread pool for it.'''
+    write_dicom(tmp_path / 'img0', SeriesInstanceUID=_series)
+
+    def _no_threads(*args, **kwargs):
+        raise AssertionError('started a thread pool')
+
+    monkeypatch.setattr(_mr, 'ThreadPoolExecutor', _no_threads)
+    share_sibling_reads(_mr._sibling_reads)
+    assert set(_series_map(str(tmp_path))) == {_series}
+
+
+def _spacing_findings(directory, names) -> dict[str, list[tuple[str, str]]]:
+    '''Validate SpacingBetweenSlices in the files `names` in `directory`, in order, with a fresh validator.
+
+    This gives each file's findings as (value, description) pairs.
+    '''
+    validator, findings = SpacingBetweenSlicesValidator(), {}
+    for name in names:
+        potential_file = PotentialFile(str(directory / name))
+        findings[name] = [(finding.value, finding.description) for finding in validator.validate(potential_file)]
+        potential_file.release()
+    return findings
+
+
+def _multiple(series: str) -> str:
+    '''Give the description of a missing SpacingBetweenSlices in a series of several slices.'''
+    return (
+        f'Multiple DICOM files in the series (with the same SeriesInstanceUID {series}) must have the'
+        ' SpacingBetweenSlices tag—in every file'
+    )
+
+
+def test_spacing_between_slices_in_one_file_series(tmp_path, write_dicom):
+    '''A series of one slice, even with a link to it or another series beside it, needs no SpacingBetweenSlices.'''
+    write_dicom(tmp_path / 'img0', SeriesInstanceUID=_series, SpacingBetweenSlices=None)
+    os.link(tmp_path / 'img0', tmp_path / 'link-to-img0')
+    write_dicom(tmp_path / 'img1', SeriesInstanceUID=_other_series, SpacingBetweenSlices=None)
+    (tmp_path / 'notes.txt').write_text('not DICOM')
+    assert _spacing_findings(tmp_path, ['img0', 'link-to-img0', 'img1']) == {'img0': [], 'link-to-img0': [], 'img1': []}
+
+
+def test_spacing_between_slices_in_multiple_file_series(tmp_path, write_dicom):
+    '''Every slice of a series of several needs a valid SpacingBetweenSlices, and only MR slices are checked.'''
+    write_dicom(tmp_path / 'img0', SeriesInstanceUID=_series, SpacingBetweenSlices=None)
+    write_dicom(tmp_path / 'img1', SeriesInstanceUID=_series, SpacingBetweenSlices='2.5')
+    write_dicom(tmp_path / 'img2', SeriesInstanceUID=_series, SpacingBetweenSlices=None)
+    write_dicom(tmp_path / 'img3', SeriesInstanceUID=_other_series, SpacingBetweenSlices='1')
+    write_dicom(tmp_path / 'img4', SeriesInstanceUID=_other_series, SpacingBetweenSlices='-1')
+    write_dicom(tmp_path / 'ct0', 'CT_small.dcm', SeriesInstanceUID=_series, SpacingBetweenSlices=None)
+    findings = _spacing_findings(tmp_path, ['img0', 'img1', 'img2', 'img3', 'img4', 'ct0'])
+    assert findings['img0'] == findings['img2'] == [('tag missing', _multiple(_series))]
+    assert findings['img1'] == findings['img3'] == findings['ct0'] == []
+    assert [value for value, description in findings['img4']] == ['-1']
+    assert findings['img4'][0][1] == _multiple(_other_series)
+
+
+def _acquisition_matrix_findings(
+    tmp_path, write_dicom, vr: str = 'US', value=None, modality: str = 'MR', decoded: bool = False
+) -> list[str]:
+    '''Validate an MR file whose AcquisitionMatrix is `value` with the given `vr`, or missing if None.
+
+    If `decoded`, the validator gets a dataset whose elements have already been decoded, as when something
+    else has looked at them first, rather than reading the file itself. This gives the values of the findings.
+    '''
+    path = write_dicom(tmp_path / 'img0', Modality=modality)
+    if value is not None:
+        ds = pydicom.dcmread(path)
+        ds.add_new(_mr._acquisition_matrix_tag, vr, value)
+        ds.save_as(path)
+    validator, potential_file = AcquisitionMatrixValidator(), PotentialFile(path)
+    if decoded:
+        ds = pydicom.dcmread(path)
+        for elem in ds: pass  # Iterating decodes every element
+        validator.dcmread = lambda potential_file: ds
+    try:
+        return [finding.value for finding in validator.validate(potential_file)]
+    finally:
+        potential_file.release()
+
+
+@pytest.mark.parametrize('decoded', [False, True])
+@pytest.mark.parametrize('vr, value', [('US', None), ('US', []), ('US', [0, 256, 192, 0]), ('US', [64, 0, 0, 64])])
+def test_acquisition_matrix_passes(tmp_path, write_dicom, vr, value, decoded):
+    '''An AcquisitionMatrix that's missing, empty, or four non-negative integers has no findings.'''
+    assert _acquisition_matrix_findings(tmp_path, write_dicom, vr, value, decoded=decoded) == []
+
+
+@pytest.mark.parametrize('decoded', [False, True])
+@pytest.mark.parametrize('vr, value, shown', [
+    ('US', [256, 192, 0], '[256, 192, 0]'),
+    ('US', 0, '0'),
+    ('US', 256, '256'),
+    ('SS', [0, 256, -192, 0], '[0, 256, -192, 0]'),
+    ('US', [0, 256, 192, 0, 1], '[0, 256, 192, 0, 1]'),
+])
+def test_acquisition_matrix_fails(tmp_path, write_dicom, vr, value, shown, decoded):
+    '''An AcquisitionMatrix without exactly four values, even a lone 0, or with a negative one, has a finding.'''
+    assert _acquisition_matrix_findings(tmp_path, write_dicom, vr, value, decoded=decoded) == [shown]
+
+
+def test_acquisition_matrix_only_checked_for_mr(tmp_path, write_dicom):
+    '''Files that aren't MR don't have their AcquisitionMatrix checked.'''
+    assert _acquisition_matrix_findings(tmp_path, write_dicom, 'US', [1, 2, 3], modality='CT') == []
@@ -0,0 +1,74 @@
+# encoding: utf-8
+
+'''🛂 EDRN DICOM Validation: tests for scanning with a pool of worker processes.'''
+
+from multiprocessing import get_all_start_methods
+import os, pytest, subprocess, sys
+
+
+_patience = 120  # How many seconds a pool scan of a small tree gets before we say it hung
+
+# Scans the tree named on the command line with the pool through the fork server, one file per task, then
+# in this process alone, and prints both counts of findings
+_fork_server_scan = '''
+import argparse, logging, sys
+from jpl.labcas.validation import main
+main.get_start_method = lambda: 'spawn'  # What macOS defaults to, which sends the pool through the fork server
+main._chunksize = 1
+args = argparse.Namespace(score=0.5, trust_burned_in_flag=True, loglevel=logging.WARNING)
+generator = main._create_non_solr_paths_iterator(sys.argv[1])
+db_path, pooled = main.validate_pool(sys.argv[1], 'simple-scoring', args, 2, generator)
+print(pooled, len(main.validate_single(sys.argv[1], 'simple-scoring', args, generator)))
+'''
+
+# Scans the tree named on the command line with a forking pool and prints how many threads this process had
+# each time it forked
+_forking_scan = '''
+import argparse, logging, multiprocessing, os, sys, threading
+from jpl.labcas.validation import main
+multiprocessing.set_start_method('fork', force=True)
+threads_at_fork = []
+os.register_at_fork(before=lambda: threads_at_fork.append(threading.active_count()))
+args = argparse.Namespace(score=0.5, trust_burned_in_flag=True, loglevel=logging.WARNING)
+main.validate_pool(sys.argv[1], 'simple-scoring', args, 2, main._create_non_solr_paths_iterator(sys.argv[1]))
+print(*threads_at_fork)
+'''
+
+
+def _run(script: str, scratch, *args) -> list[str]:
+    '''Run `script` in a fresh interpreter with `args` and temporary files in `scratch`, and give the words it prints.
+
+    A fresh interpreter keeps the pool's start method and any fork hooks out of the test process, and
+    lets a hung pool be killed.
+    '''
+    os.makedirs(scratch, exist_ok=True)
+    result = subprocess.run(
+        [sys.executable, '-c', script, *args], capture_output=True, text=True, timeout=_patience,
+        env={**os.environ, 'TMPDIR': str(scratch)}
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.split()
+
+
+def _make_tree(root, write_dicom, count: int = 24) -> str:
+    '''Make a collection at `root` with `count` DICOM files spread over two sites and give its path.'''
+    collection = root / 'Prostate_MRI'
+    for idx in range(count):
+        site = 'Images_Site_aaa' if idx % 2 else 'Images_Site_bbb'
+        write_dicom(collection / site / '1234567' / f'img{idx}', PatientName='DOE^JOHN')
+    return str(collection)
+
+
+def test_fork_server_pool_finishes_with_every_finding(tmp_path, write_dicom):
+    '''A pool of fork-server workers, each given many tasks, finishes and finds what one process does.'''
+    pooled, single = _run(_fork_server_scan, tmp_path / 'scratch', _make_tree(tmp_path, write_dicom))
+    assert int(pooled) > 0
+    assert int(pooled) == int(single)
+
+
+@pytest.mark.skipif('fork' not in get_all_start_methods(), reason='needs the fork start method')
+def test_forked_workers_start_before_any_threads(tmp_path, write_dicom):
+    '''Forked workers come from a process with just the one thread, not one that's mid-walk.'''
+    threads_at_fork = _run(_forking_scan, tmp_path / 'scratch', _make_tree(tmp_path, write_dicom))
+    assert threads_at_fork
+    assert set(threads_at_fork) == {'1'}
@@ -0,0 +1,31 @@
+# encoding: utf-8
+
+'''🛂 EDRN DICOM Validation: tests for potential files.'''
+
+from jpl.labcas.validation._classes import PotentialFile
+
+
+_path = '/c/Images_Site_aaa/1234567/series/a.dcm'
+
+
+def test_get_shares_one_instance_per_path():
+    '''Getting the same path again gives back the same live potential file.'''
+    potential_file = PotentialFile.get(_path)
+    assert PotentialFile.get(_path) is potential_file
+    assert (potential_file.site_id, potential_file.event_id) == ('Images_Site_aaa', '1234567')
+
+
+def test_get_takes_ids_given_for_a_live_file():
+    '''IDs given for a file that's already alive replace the ones it got from its path.'''
+    potential_file = PotentialFile.get(_path)
+    assert PotentialFile.get(_path, site_id='Site_from_Solr', event_id='7654321') is potential_file
+    assert (potential_file.site_id, potential_file.event_id) == ('Site_from_Solr', '7654321')
+    PotentialFile.get(_path)
+    assert (potential_file.site_id, potential_file.event_id) == ('Site_from_Solr', '7654321')
+
+
+def test_ids_need_not_be_strings():
+    '''Site and event IDs that aren't strings, as Solr documents may have, are kept as they are.'''
+    potential_file = PotentialFile('/c/unorganized/a.dcm', site_id=42, event_id=1234567)
+    assert (potential_file.site_id, potential_file.event_id) == (42, 1234567)
+    assert PotentialFile.get('/c/unorganized/a.dcm', site_id=43).site_id == 43
@@ -0,0 +1,131 @@
+# encoding: utf-8
+
+'''🛂 EDRN DICOM Validation: tests for the simple scoring PHI/PII recognizer.'''
+
+from jpl.labcas.validation.phi_pii_recognizers import _simple_scoring
+from jpl.labcas.validation.phi_pii_recognizers._simple_scoring import SimpleScoring_PHI_PII_Recognizer
+from collections import OrderedDict
+from PIL import Image
+import argparse, pytest, pytesseract
+
+
+def _recognizer() -> SimpleScoring_PHI_PII_Recognizer:
+    '''Make a simple scoring recognizer.'''
+    return SimpleScoring_PHI_PII_Recognizer(argparse.Namespace(score=0.5))
+
+
+def _frames(count: int) -> list[Image.Image]:
+    '''Make `count` small grayscale frames, each a different shade.'''
+    return [Image.new('L', (8, 8), shade) for shade in range(count)]
+
+
+def _data(*words) -> dict[str, list]:
+    '''Make tesseract's output as pytesseract gives it from (page, text, left, top, width, height) words.'''
+    pages, texts, lefts, tops, widths, heights = zip(*words) if words else ((),) * 6
+    return {
+        'page_num': list(pages), 'text': list(texts), 'left': list(lefts), 'top': list(tops),
+        'width': list(widths), 'height': list(heights),
+    }
+
+
+def test_ocr_frames_splits_one_run_by_page(monkeypatch):
+    '''One tesseract run over all the frames gives each frame the text and boxes of its own page.'''
+    calls = []
+
+    def _image_to_data(image, output_type):
+        calls.append(image)
+        return _data(
+            (1, 'DOE', 1, 2, 3, 4), (1, '', 9, 9, 9, 9), (1, 'JOHN', 5, 6, 7, 8),
+            (3, '555-1212', 10, 20, 30, 40),
+            (0, 'before', 0, 0, 1, 1), (4, 'after', 0, 0, 1, 1),  # Pages that aren't any frame of ours
+        )
+
+    monkeypatch.setattr(pytesseract, 'image_to_data', _image_to_data)
+    results = _recognizer()._ocr_frames(_frames(3))
+    assert len(calls) == 1 and isinstance(calls[0], str)
+    assert results == [
+        ('DOEJOHN', [(1, 2, 3, 4), (5, 6, 7, 8)]),
+        ('', []),
+        ('555-1212', [(10, 20, 30, 40)]),
+    ]
+
+
+def test_ocr_frames_falls_back_to_one_frame_at_a_time(monkeypatch):
+    '''If the run over all the frames fails, each frame gets its own run instead.'''
+    frames, calls = _frames(3), []
+
+    def _image_to_data(image, output_type):
+        calls.append(image)
+        if isinstance(image, str): raise pytesseract.TesseractError(1, 'no list files here')
+        return _data((1, f'frame{frames.index(image)}', 0, 0, 1, 1))
+
+    monkeypatch.setattr(pytesseract, 'image_to_data', _image_to_data)
+    results = _recognizer()._ocr_frames(frames)
+    assert len(calls) == 4 and isinstance(calls[0], str) and calls[1:] == frames
+    assert results == [('frame0', [(0, 0, 1, 1)]), ('frame1', [(0, 0, 1, 1)]), ('frame2', [(0, 0, 1, 1)])]
+
+
+@pytest.mark.parametrize('count', [0, 1])
+def test_ocr_frames_runs_fewer_than_two_frames_directly(monkeypatch, count):
+    '''With fewer than two frames, there's nothing to batch and no list file to write.'''
+    calls = []
+
+    def _image_to_data(image, output_type):
+        calls.append(image)
+        return _data((1, 'text', 0, 0, 1, 1))
+
+    monkeypatch.setattr(pytesseract, 'image_to_data', _image_to_data)
+    frames = _frames(count)
+    assert _recognizer()._ocr_frames(frames) == [('text', [(0, 0, 1, 1)])] * count
+    assert calls == frames
+
+
+@pytest.fixture
+def ocr_runs(monkeypatch) -> list[list[Image.Image]]:
+    '''Start with an empty OCR cache and stub out OCR, giving the list of frames of each run it's asked for.
+
+    The stubbed OCR recognizes a frame's shade as its text.
+    '''
+    runs = []
+
+    def _ocr_frames(self, frames):
+        runs.append(frames)
+        return [(f'shade{frame.getpixel((0, 0))}', []) for frame in frames]
+
+    monkeypatch.setattr(_simple_scoring, '_ocr_cache', OrderedDict())
+    monkeypatch.setattr(SimpleScoring_PHI_PII_Recognizer, '_ocr_frames', _ocr_frames)
+    return runs
+
+
+def test_duplicate_frames_in_a_file_are_recognized_once(ocr_runs):
+    '''Frames of a file that look the same go to OCR once and each gets the result.'''
+    first, second = _frames(2)
+    results = _recognizer()._recognize_all_characters([first, second, Image.new('L', (8, 8), 0), first])
+    assert [text for text, boxes in results] == ['shade0', 'shade1', 'shade0', 'shade0']
+    assert [len(run) for run in ocr_runs] == [2]
+
+
+def test_frames_seen_before_skip_ocr(ocr_runs):
+    '''A later file's frames that match ones already recognized, even by another recognizer, skip OCR.'''
+    _recognizer()._recognize_all_characters(_frames(2))
+    results = _recognizer()._recognize_all_characters(_frames(3))
+    assert [text for text, boxes in results] == ['shade0', 'shade1', 'shade2']
+    assert [[frame.getpixel((0, 0)) for frame in run] for run in ocr_runs] == [[0, 1], [2]]
+    assert _recognizer()._recognize_all_characters(_frames(3)) == results
+    assert len(ocr_runs) == 2
+
+
+def test_ocr_cache_keeps_the_most_recent(ocr_runs, monkeypatch):
+    '''The OCR cache never holds more than its size, letting go of the least recently used frames first.'''
+    monkeypatch.setattr(_simple_scoring, '_ocr_cache_size', 3)
+    recognizer, frames = _recognizer(), _frames(5)
+    for frame in frames[:3]: recognizer._recognize_all_characters([frame])
+    recognizer._recognize_all_characters([frames[0]])     # Now the most recently used
+    recognizer._recognize_all_characters(frames[3:5])     # Pushes out frames 1 and 2
+    assert len(_simple_scoring._ocr_cache) <= _simple_scoring._ocr_cache_size
+    del ocr_runs[:]
+    recognizer._recognize_all_characters([frames[0], frames[4]])
+    assert ocr_runs == []
+    recognizer._recognize_all_characters([frames[1]])
+    assert ocr_runs == [[frames[1]]]
+    assert len(_simple_scoring._ocr_cache) <= _simple_scoring._ocr_cache_size
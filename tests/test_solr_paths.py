@@ -0,0 +1,79 @@
+# encoding: utf-8
+
+'''🛂 EDRN DICOM Validation: tests for checking files against Solr.'''
+
+from jpl.labcas.validation import main
+from collections import Counter
+import argparse, os, pysolr, re, threading
+
+
+class _FakeSolr:
+    '''Stands in for pysolr.Solr, answering searches for file IDs from a fixed set of published ones.'''
+
+    _terms_query = re.compile(r'^\{!terms f=id separator="(.)"\}(.*)$')
+    _or_query = re.compile(r'^id:\((.*)\)$')
+
+    def __init__(self, published: dict[str, tuple[str, str]]):
+        self.published, self.queries, self._lock = published, [], threading.Lock()
+
+    def __call__(self, url, **kwargs):
+        return self  # Every pysolr.Solr(url, …) the iterator makes is this one
+
+    def search(self, query: str, rows: int, fl: list[str]):
+        '''Find the published files among the IDs in `query`.'''
+        with self._lock: self.queries.append(query)
+        if match := self._terms_query.match(query):
+            ids = match.group(2).split(match.group(1))
+        else:
+            ids = [quoted.strip('"') for quoted in self._or_query.match(query).group(1).split(' OR ')]
+        assert rows >= len(ids)
+        docs = [
+            {'id': [file_id], 'BlindedSiteID': [self.published[file_id][0]], 'eventID': [self.published[file_id][1]]}
+            for file_id in ids if file_id in self.published
+        ]
+        return argparse.Namespace(docs=docs)
+
+
+def _make_collection(root, count: int) -> tuple[str, dict[str, tuple[str, str]]]:
+    '''Make a collection of `count` files under `root`, publishing every third of them in a fake Solr.
+
+    This gives the collection's path and the published files' paths with their Solr site and event IDs.
+    '''
+    collection, published = root / 'Prostate_MRI', {}
+    for idx in range(count):
+        path = collection / f'Images_Site_{idx % 4}' / f'{idx % 3:07d}' / f'img{idx}'
+        os.makedirs(path.parent, exist_ok=True)
+        path.write_bytes(b'')
+        if idx % 3 == 0: published[str(path)] = (f'site{idx}', f'event{idx}')
+    return str(collection), published
+
+
+def _solr_ids(collection: str, published: dict[str, tuple[str, str]]) -> dict[str, tuple[str, str]]:
+    '''Turn the published files' paths into their Solr IDs, which start at the collection's folder.'''
+    start = len(os.path.dirname(collection)) + 1
+    return {path[start:]: ids for path, ids in published.items()}
+
+
+def test_every_published_file_comes_once_with_solr_ids(tmp_path, monkeypatch):
+    '''Every published file comes out exactly once, with its site and event from Solr, and nothing else does.'''
+    collection, published = _make_collection(tmp_path, 200)
+    solr = _FakeSolr(_solr_ids(collection, published))
+    monkeypatch.setattr(pysolr, 'Solr', solr)
+    files = list(main._create_solr_paths_iterator('http://solr/', collection, batch_size=7)())
+    assert Counter(potential_file.path for potential_file in files) == Counter(list(published))
+    assert {potential_file.path: (potential_file.site_id, potential_file.event_id) for potential_file in files} == published
+    assert len(solr.queries) == -(-200 // 7)
+    assert all(query.startswith('{!terms f=id separator="|"}') for query in solr.queries)
+
+
+def test_ids_with_the_separator_fall_back_to_or_query(tmp_path, monkeypatch):
+    '''A batch with an ID that has the terms separator in it is looked up with a boolean query instead.'''
+    collection, published = _make_collection(tmp_path, 20)
+    odd = os.path.join(collection, 'Images_Site_0', '0000000', 'img|odd')
+    open(odd, 'wb').close()
+    published[odd] = ('site-odd', 'event-odd')
+    solr = _FakeSolr(_solr_ids(collection, published))
+    monkeypatch.setattr(pysolr, 'Solr', solr)
+    files = list(main._create_solr_paths_iterator('http://solr/', collection, batch_size=50)())
+    assert Counter(potential_file.path for potential_file in files) == Counter(list(published))
+    assert len(solr.queries) == 1 and solr.queries[0].startswith('id:(')